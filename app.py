@@ -11,13 +11,15 @@ from src.data.repositories.player_repository import PlayerRepository
 from src.business.services.player_service import PlayerService
 from src.business.services.match_service import MatchService
 from src.business.services.ranking_service import RankingService
+from src.business.services.diagnostics_service import DiagnosticsService
 from src.presentation.components.layout import setup_page_config, apply_custom_css, get_navigation_menu
 from src.presentation.pages import (
     render_ranking_page,
     render_profiles_page,
     render_statistics_page,
     render_manage_players_page,
-    render_performance_page
+    render_performance_page,
+    render_diagnostics_page
 )
 
 if not validate_api_key():
@@ -30,10 +32,18 @@ if not validate_api_key():
 
 set_api_key(FACEIT_API_KEY)
 
-player_repository = PlayerRepository()
-player_service = PlayerService(player_repository)
-match_service = MatchService()
-ranking_service = RankingService(player_repository)
+@st.cache_resource
+def get_services():
+    player_repository = PlayerRepository()
+    match_service = MatchService(player_repository)
+    return (
+        PlayerService(player_repository, match_service),
+        match_service,
+        RankingService(player_repository),
+        DiagnosticsService()
+    )
+
+player_service, match_service, ranking_service, diagnostics_service = get_services()
 
 setup_page_config()
 apply_custom_css()
@@ -53,3 +63,5 @@ elif menu == "📈 Análise de Desempenho":
     render_performance_page(player_service, match_service)
 elif menu == "➕ Gerenciar":
     render_manage_players_page(player_service)
+elif menu == "🩺 Diagnóstico":
+    render_diagnostics_page(diagnostics_service)
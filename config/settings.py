@@ -1,21 +1,97 @@
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 FACEIT_API_KEY = os.environ.get("FACEIT_API_KEY")
+FACEIT_API_BASE_URL = os.environ.get("FACEIT_API_BASE_URL", "https://open.faceit.com/data/v4")
 DATABASE_NAME = "leotv_players.db"
+DATABASE_POOL_ENABLED = True
+DATABASE_POOL_SIZE = 8
+DATABASE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -16000,
+    "mmap_size": 134217728,
+    "busy_timeout": 5000,
+    "temp_store": "MEMORY"
+}
 
 CACHE_DEFAULT_TTL = 3600
 CACHE_PLAYER_ID_TTL = 3600
 CACHE_MATCH_HISTORY_TTL = 1800
 CACHE_MATCH_STATS_TTL = 86400
 CACHE_PLAYER_STATS_TTL = 3600
+CACHE_MATCH_HISTORY_SYNC_TTL = 604800
+CACHE_DERIVED_TTL = 86400
+
+CACHE_PLAYER_ID_STALE_TTL = 3600
+CACHE_MATCH_HISTORY_STALE_TTL = 3600
+CACHE_PLAYER_STATS_STALE_TTL = 7200
+CACHE_REFRESH_WORKERS = 4
+CACHE_SHARDS = 16
+CACHE_JANITOR_INTERVAL = 60
+
+CACHE_MAX_MEMORY_MB = 256
+CACHE_PREFIX_MAX_MEMORY_MB = {
+    "match_stats": 120,
+    "match_history": 40,
+    "match_history_sync": 40,
+    "player_stats": 24,
+    "derived": 16
+}
+
+CACHE_PREFIX_CODECS = {
+    "match_stats": "zlib",
+    "match_history_sync": "zlib",
+    "player_stats": "zlib"
+}
+CACHE_COMPRESSION_MIN_BYTES = 2048
+
+CACHE_DISK_ENABLED = True
+CACHE_DISK_PATH = str(PROJECT_ROOT / "leotv_cache.db")
+CACHE_DISK_PREFIXES = ["match_stats", "match_history_sync"]
+CACHE_DISK_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000
+}
+
+MATCH_HISTORY_INCREMENTAL_SYNC = True
+MATCH_HISTORY_SYNC_PAGE_SIZE = 10
+MATCH_WIN_RESULTS = ["1", "victory", "win", "won"]
+MATCH_DEFAULT_DEATHS = 1
+
+API_MAX_WORKERS = 8
+API_CONNECT_TIMEOUT = 3.05
+API_READ_TIMEOUT = 10
+API_MAX_RETRIES = 3
+API_BACKOFF_BASE = 0.5
+API_BACKOFF_MAX = 8
+API_POOL_SIZE = 16
+API_ASYNC_MAX_CONCURRENCY = 32
+API_RATE_LIMIT_PER_SECOND = 10
+API_RATE_LIMIT_BURST = 20
+API_RATE_LIMIT_MAX_RETRIES = 5
+API_RATE_LIMIT_DEFAULT_RETRY_AFTER = 1
+API_LATENCY_BUCKETS_MS = [50, 100, 250, 500, 1000, 2500, 5000]
+
+ROSTER_REFRESH_WORKERS = 8
+
+ELO_CLIMBERS_PERIOD_DAYS = 7
+ELO_CLIMBERS_LIMIT = 5
+ELO_TREND_DAYS = 90
+ELO_TREND_BUCKET_SECONDS = 86400
 
 APP_TITLE = "LeleoTV CS2 Stats"
 APP_ICON = "static/leleo.png"
 APP_LAYOUT = "wide"
 
+DIAGNOSTICS_ENABLED = os.environ.get("LEOTV_DIAGNOSTICS", "").lower() in ("1", "true", "yes")
+
 def validate_api_key():
     if not FACEIT_API_KEY or FACEIT_API_KEY == "CHAVE_DE_API_DO_PROJETO_LEOTV":
         return False
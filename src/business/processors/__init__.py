@@ -2,6 +2,7 @@
 Módulo de processamento de dados e cálculos de métricas.
 """
 from .data_processor import (
+    is_win,
     process_player_matches,
     calculate_rws_leotv,
     calculate_rws,
@@ -9,6 +10,7 @@ from .data_processor import (
 )
 
 __all__ = [
+    'is_win',
     'process_player_matches',
     'calculate_rws_leotv',
     'calculate_rws',
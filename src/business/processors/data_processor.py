@@ -1,4 +1,8 @@
 import pandas as pd
+from config.settings import MATCH_WIN_RESULTS, MATCH_DEFAULT_DEATHS
+
+def is_win(result):
+    return str(result).lower() in MATCH_WIN_RESULTS
 
 def process_player_matches(matches, player_nickname):
     if not matches:
@@ -15,17 +19,12 @@ def process_player_matches(matches, player_nickname):
     for match in matches:
         stats = match.get("stats", {})
         total_kills += int(stats.get("Kills", 0) or stats.get("kills", 0))
-        total_deaths += int(stats.get("Deaths", 1) or stats.get("deaths", 1))
+        total_deaths += int(stats.get("Deaths", MATCH_DEFAULT_DEATHS) or stats.get("deaths", MATCH_DEFAULT_DEATHS))
         total_assists += int(stats.get("Assists", 0) or stats.get("assists", 0))
         total_headshots += int(stats.get("Headshots", 0) or stats.get("headshots", 0))
         total_mvps += int(stats.get("MVPs", 0) or stats.get("mvps", 0))
         
-        result = match.get("result", "")
-        if isinstance(result, str):
-            result_lower = result.lower()
-            if result == "1" or result_lower in ["victory", "win", "won"]:
-                wins += 1
-        elif result == 1:
+        if is_win(match.get("result", "")):
             wins += 1
             
     return {
@@ -55,12 +54,9 @@ def calculate_rws(matches, player_id):
         assists = int(stats.get("Assists", 0))
         damage = int(stats.get("Damage", 0))
         
-        result = match.get("result", "")
-        is_win = result == "1" or result.lower() == "victory" or result.lower() == "win"
-        
         base_score = (kills * 2.0) + (assists * 1.0) + (damage * 0.01)
         
-        if is_win:
+        if is_win(match.get("result", "")):
             base_score *= 1.5
         
         total_rws += base_score
@@ -0,0 +1,31 @@
+import hashlib
+from typing import Any, Callable, Dict, Iterable, Optional
+from ...data.cache.cache_manager import get_cache
+from ...data.api.faceit_api import player_tag
+from config.settings import CACHE_DERIVED_TTL
+
+def match_fingerprint(matches: Iterable[Dict], *params: Any) -> str:
+    digest = hashlib.sha1()
+    for match in matches:
+        digest.update(str(match.get("match_id")).encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(repr(params).encode("utf-8"))
+    return digest.hexdigest()
+
+def memoize_derived(kind: str, player_id: Optional[str], matches: Iterable[Dict], compute: Callable[[], Any],
+                    *params: Any) -> Any:
+    if not player_id:
+        return compute()
+    
+    cache = get_cache()
+    identifier = f"{kind}:{player_id}"
+    fingerprint = match_fingerprint(matches, *params)
+    
+    cached = cache.get("derived", identifier)
+    if cached is not None and cached["fingerprint"] == fingerprint:
+        return cached["value"]
+    
+    value = compute()
+    cache.set("derived", identifier, {"fingerprint": fingerprint, "value": value},
+              ttl_seconds=CACHE_DERIVED_TTL, tags=[player_tag(player_id)])
+    return value
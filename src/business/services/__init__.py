@@ -4,6 +4,7 @@ Módulo de serviços de lógica de negócio.
 from .player_service import PlayerService
 from .match_service import MatchService
 from .ranking_service import RankingService
+from .diagnostics_service import DiagnosticsService
 
-__all__ = ['PlayerService', 'MatchService', 'RankingService']
+__all__ = ['PlayerService', 'MatchService', 'RankingService', 'DiagnosticsService']
 
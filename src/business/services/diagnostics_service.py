@@ -0,0 +1,23 @@
+from typing import Dict
+from ...data.cache.cache_manager import get_cache
+from ...data.api.rate_limiter import get_rate_limiter
+from ...data.api.telemetry import get_api_telemetry
+from ...data.cache.single_flight import get_single_flight
+
+class DiagnosticsService:
+    def get_cache_stats(self) -> Dict:
+        cache = get_cache()
+        stats = cache.get_stats()
+        stats['disk_entries'] = cache.count_disk_entries()
+        return stats
+    
+    def get_api_stats(self) -> Dict:
+        return {
+            'endpoints': get_api_telemetry().get_stats(),
+            'rate_limiter': get_rate_limiter().get_stats(),
+            'coalesced_calls': get_single_flight().coalesced_calls
+        }
+    
+    def reset(self) -> None:
+        get_cache().reset_metrics()
+        get_api_telemetry().reset()
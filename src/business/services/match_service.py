@@ -1,16 +1,56 @@
 from typing import List, Optional, Dict
-from ...data.api.faceit_api import get_player_matches
+from ...data.repositories.player_repository import PlayerRepository
+from ...data.api.faceit_api import get_match_history, get_player_matches, build_player_matches
+from ..processors.data_processor import calculate_rws
+from ..processors.derived_cache import memoize_derived
 
 class MatchService:
+    def __init__(self, player_repository: Optional[PlayerRepository] = None):
+        self.repository = player_repository
+    
+    def get_player_matches(self, faceit_id: str, limit: int = 20, use_cache: bool = True) -> Optional[List[Dict]]:
+        if self.repository is None:
+            return get_player_matches(faceit_id, limit=limit, use_cache=use_cache)
+        
+        history = get_match_history(faceit_id, limit, use_cache)
+        if not history:
+            local_matches = self.repository.get_recent_matches(faceit_id, limit)
+            return local_matches or None
+        
+        stored = self.repository.get_matches_by_ids(faceit_id, [match.get("match_id") for match in history])
+        missing = [match for match in history if match.get("match_id") not in stored]
+        if missing:
+            fetched = build_player_matches(faceit_id, missing, use_cache)
+            if fetched:
+                self.repository.save_matches(faceit_id, fetched)
+                stored.update((match["match_id"], match) for match in fetched)
+        
+        detailed_matches = [stored[match.get("match_id")] for match in history if match.get("match_id") in stored]
+        return detailed_matches or None
+    
+    @staticmethod
+    def get_rws(matches: List[Dict], player_id: str) -> float:
+        return memoize_derived("rws", player_id, matches, lambda: calculate_rws(matches, player_id))
+    
     @staticmethod
-    def get_player_matches(faceit_id: str, limit: int = 20, use_cache: bool = True) -> Optional[List[Dict]]:
-        return get_player_matches(faceit_id, limit=limit, use_cache=use_cache)
+    def get_rws_per_match(matches: List[Dict], player_id: str) -> List[float]:
+        return memoize_derived("rws_per_match", player_id, matches,
+                               lambda: [calculate_rws([match], player_id) for match in matches])
     
     @staticmethod
     def format_match_data_for_display(matches: List[Dict], limit: int = 5, player_id: str = None) -> List[Dict]:
+        return memoize_derived("match_data_display", player_id, matches,
+                               lambda: MatchService._build_match_data(matches, limit, player_id), limit)
+    
+    @staticmethod
+    def format_match_history_for_display(matches: List[Dict], player_id: str = None) -> List[Dict]:
+        return memoize_derived("match_history_display", player_id, matches,
+                               lambda: MatchService._build_match_history(matches, player_id))
+    
+    @staticmethod
+    def _build_match_data(matches: List[Dict], limit: int = 5, player_id: str = None) -> List[Dict]:
         import pandas as pd
         from datetime import datetime
-        from ...business.processors.data_processor import calculate_rws
         
         match_data = []
         for match in matches[:limit]:
@@ -108,10 +148,9 @@ class MatchService:
         return match_data
     
     @staticmethod
-    def format_match_history_for_display(matches: List[Dict], player_id: str = None) -> List[Dict]:
+    def _build_match_history(matches: List[Dict], player_id: str = None) -> List[Dict]:
         import pandas as pd
         from datetime import datetime
-        from ...business.processors.data_processor import calculate_rws
         
         match_history = []
         for match in matches:
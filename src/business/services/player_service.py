@@ -1,11 +1,16 @@
+import time
 from typing import Optional, Dict, List
 from ...data.repositories.player_repository import PlayerRepository
-from ...data.api.faceit_api import get_player_id, get_player_matches
+from ...data.api.faceit_api import get_player_id
+from .match_service import MatchService
 from ..processors.data_processor import process_player_matches
+from ..processors.derived_cache import memoize_derived
+from config.settings import ELO_TREND_DAYS, ELO_TREND_BUCKET_SECONDS
 
 class PlayerService:
-    def __init__(self, player_repository: PlayerRepository):
+    def __init__(self, player_repository: PlayerRepository, match_service: Optional[MatchService] = None):
         self.repository = player_repository
+        self.match_service = match_service or MatchService(player_repository)
     
     def add_player(self, nickname: str) -> Dict:
         player_data = get_player_id(nickname, use_cache=True)
@@ -45,12 +50,13 @@ class PlayerService:
         return self.repository.get_player_by_nickname(nickname)
     
     def get_player_stats(self, faceit_id: str, nickname: str, limit: int = 20) -> Optional[Dict]:
-        matches = get_player_matches(faceit_id, limit=limit, use_cache=True)
+        matches = self.match_service.get_player_matches(faceit_id, limit=limit, use_cache=True)
         
         if not matches:
             return None
         
-        return process_player_matches(matches, nickname)
+        return memoize_derived("player_stats", faceit_id, matches,
+                               lambda: process_player_matches(matches, nickname), nickname)
     
     def update_player_stats(self, nickname: str) -> bool:
         player_data = get_player_id(nickname, use_cache=False)
@@ -65,6 +71,23 @@ class PlayerService:
             avatar_url=player_data.get("avatar_url")
         )
     
+    def get_lifetime_stats(self, faceit_id: str) -> Optional[Dict]:
+        return self.repository.get_player_aggregates(faceit_id)
+    
+    def get_all_lifetime_stats(self) -> List[Dict]:
+        return self.repository.get_all_player_aggregates()
+    
+    def get_map_stats(self, faceit_id: str) -> List[Dict]:
+        return self.repository.get_player_map_aggregates(faceit_id)
+    
+    def get_elo_trend(self, faceit_id: str, days: int = ELO_TREND_DAYS, 
+                      bucket_seconds: int = ELO_TREND_BUCKET_SECONDS) -> List[Dict]:
+        since = int(time.time()) - days * 86400
+        return [
+            {'recorded_at': recorded_at, 'elo': elo, 'level': level}
+            for recorded_at, elo, level in self.repository.get_elo_series(faceit_id, bucket_seconds, start=since)
+        ]
+    
     def delete_player(self, nickname: str) -> bool:
         return self.repository.delete_player(nickname)
 
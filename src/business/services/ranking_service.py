@@ -1,7 +1,9 @@
-from typing import List, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
 from ...data.repositories.player_repository import PlayerRepository
-from ...data.api.faceit_api import get_player_id
-from ...data.cache.cache_manager import get_cache
+from ...data.api.faceit_api import get_player_id, invalidate_player
+from config.settings import ROSTER_REFRESH_WORKERS, ELO_CLIMBERS_PERIOD_DAYS, ELO_CLIMBERS_LIMIT
 
 class RankingService:
     def __init__(self, player_repository: PlayerRepository):
@@ -10,35 +12,66 @@ class RankingService:
     def get_ranking(self) -> List[tuple]:
         return self.repository.get_all_players()
     
-    def update_all_players(self) -> Dict:
+    def get_top_climbers(self, days: int = ELO_CLIMBERS_PERIOD_DAYS, limit: Optional[int] = ELO_CLIMBERS_LIMIT) -> List[Dict]:
+        since = int(time.time()) - days * 86400
+        return [
+            {
+                'nickname': nickname,
+                'faceit_id': faceit_id,
+                'start_elo': start_elo,
+                'end_elo': end_elo,
+                'delta': delta
+            }
+            for nickname, faceit_id, start_elo, end_elo, delta in self.repository.get_elo_changes(since, limit=limit, gains_only=True)
+        ]
+    
+    def update_all_players(self, max_workers: int = ROSTER_REFRESH_WORKERS) -> Dict:
+        started_at = time.perf_counter()
         players = self.repository.get_all_players()
-        updated_count = 0
-        failed_count = 0
-        cache = get_cache()
         
-        for player in players:
-            nickname, faceit_id = player[0], player[1]
-            player_data = get_player_id(nickname, use_cache=False)
+        def fetch_player(player):
+            fetch_started_at = time.perf_counter()
+            player_data = get_player_id(player[0], use_cache=False)
+            return player_data, time.perf_counter() - fetch_started_at
+        
+        workers = max(1, min(max_workers, len(players)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetched = list(executor.map(fetch_player, players))
+        
+        details = {}
+        updates = []
+        for player, (player_data, elapsed) in zip(players, fetched):
+            nickname = player[0]
+            details[nickname] = {
+                'success': False,
+                'elapsed_ms': round(elapsed * 1000, 1),
+                'error': None
+            }
             
             if player_data:
-                success = self.repository.update_player_stats(
-                    nickname=nickname,
-                    elo=player_data.get("elo"),
-                    level=player_data.get("level"),
-                    avatar_url=player_data.get("avatar_url")
-                )
-                
-                if success:
-                    updated_count += 1
-                    cache.invalidate("match_history", f"{faceit_id}_20")
-                else:
-                    failed_count += 1
+                updates.append((nickname, player_data.get("elo"), player_data.get("level"), player_data.get("avatar_url")))
             else:
+                details[nickname]['error'] = "Falha ao consultar a API FACEIT"
+        
+        written = self.repository.update_players_stats_batch(updates) if updates else {}
+        
+        updated_count = 0
+        failed_count = 0
+        for player, (player_data, _) in zip(players, fetched):
+            nickname = player[0]
+            if written.get(nickname):
+                details[nickname]['success'] = True
+                updated_count += 1
+                invalidate_player(player[1] or player_data.get("player_id"))
+            else:
+                if details[nickname]['error'] is None:
+                    details[nickname]['error'] = "Falha ao gravar no banco de dados"
                 failed_count += 1
         
         return {
             'success': updated_count > 0,
             'updated_count': updated_count,
-            'failed_count': failed_count
+            'failed_count': failed_count,
+            'elapsed_ms': round((time.perf_counter() - started_at) * 1000, 1),
+            'players': details
         }
-
@@ -5,17 +5,25 @@ from .faceit_api import (
     get_player_id,
     get_match_history,
     get_player_matches,
+    build_player_matches,
     get_match_stats,
+    get_match_summary,
     get_player_stats,
-    set_api_key
+    invalidate_player,
+    set_api_key,
+    set_base_url
 )
 
 __all__ = [
     'get_player_id',
     'get_match_history',
     'get_player_matches',
+    'build_player_matches',
     'get_match_stats',
+    'get_match_summary',
     'get_player_stats',
-    'set_api_key'
+    'invalidate_player',
+    'set_api_key',
+    'set_base_url'
 ]
 
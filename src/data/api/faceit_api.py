@@ -1,262 +1,440 @@
 import requests
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 root_dir = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(root_dir))
 
 from src.data.cache.cache_manager import get_cache
+from src.data.cache.single_flight import get_single_flight
+from src.data.api.http_client import get_http_client
 from config.settings import (
+    FACEIT_API_BASE_URL,
     CACHE_PLAYER_ID_TTL,
     CACHE_MATCH_HISTORY_TTL,
     CACHE_MATCH_STATS_TTL,
-    CACHE_PLAYER_STATS_TTL
+    CACHE_PLAYER_STATS_TTL,
+    CACHE_PLAYER_ID_STALE_TTL,
+    CACHE_MATCH_HISTORY_STALE_TTL,
+    CACHE_PLAYER_STATS_STALE_TTL,
+    CACHE_MATCH_HISTORY_SYNC_TTL,
+    MATCH_HISTORY_INCREMENTAL_SYNC,
+    MATCH_HISTORY_SYNC_PAGE_SIZE,
+    API_MAX_WORKERS
+)
+
+SLIM_PLAYER_STAT_KEYS = (
+    "Kills",
+    "Deaths",
+    "Assists",
+    "Headshots",
+    "Headshots %",
+    "K/D Ratio",
+    "K/R Ratio",
+    "MVPs",
+    "Damage",
+    "ADR",
+    "Result"
 )
 
 API_KEY = None
+API_BASE_URL = FACEIT_API_BASE_URL.rstrip("/")
 cache = get_cache(ttl_seconds=3600)
+http_client = get_http_client()
+in_flight = get_single_flight()
 
 def set_api_key(api_key: str):
     global API_KEY
-    API_KEY = api_key 
+    API_KEY = api_key
+    http_client.set_api_key(api_key)
 
-def get_player_id(nickname, use_cache=True):
-    if not API_KEY:
-        print("Erro de API: A chave não foi carregada.")
-        return None
+def set_base_url(base_url: str):
+    global API_BASE_URL
+    API_BASE_URL = base_url.rstrip("/")
+
+def _parse_player_data(nickname, data):
+    cs2_data = data.get("games", {}).get("cs2", {})
+    elo = cs2_data.get("faceit_elo", 0)
+    level = cs2_data.get("skill_level", 0)
+    
+    return {
+        "nickname": nickname, 
+        "player_id": data["player_id"],
+        "elo": elo,
+        "level": level,
+        "avatar_url": data.get("avatar")
+    }
+
+def player_tag(player_id):
+    return f"player:{player_id}"
+
+def invalidate_player(player_id):
+    return cache.invalidate_tag(player_tag(player_id))
+
+def _cached_fetch(prefix, identifier, fetch, ttl_seconds, use_cache=True, stale_ttl_seconds=None, tags=None):
+    flight_key = f"{prefix}:{identifier}"
     
     if use_cache:
-        cached_data = cache.get("player_id", nickname.lower())
+        refresh = (lambda: in_flight.do(flight_key, fetch)) if stale_ttl_seconds else None
+        cached_data = cache.get(prefix, identifier, refresh=refresh)
         if cached_data is not None:
             return cached_data
-        
-    url = "https://open.faceit.com/data/v4/players"
-    headers = {"Authorization": f"Bearer {API_KEY}"}
-    params = {"nickname": nickname} 
     
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        cs2_data = data.get("games", {}).get("cs2", {})
-        elo = cs2_data.get("faceit_elo", 0)
-        level = cs2_data.get("skill_level", 0)
-        
-        result = {
-            "nickname": nickname, 
-            "player_id": data["player_id"],
-            "elo": elo,
-            "level": level,
-            "avatar_url": data.get("avatar")
-        }
-        
-        if use_cache:
-            cache.set("player_id", nickname.lower(), result, ttl_seconds=CACHE_PLAYER_ID_TTL)
-        
-        return result
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching player ID for {nickname}: {e}")
-        return None
+    def load():
+        started_at = time.perf_counter()
+        data = fetch()
+        cache.record_fill(prefix, time.perf_counter() - started_at)
+        if use_cache and data is not None:
+            entry_tags = tags(data) if callable(tags) else tags
+            cache.set(prefix, identifier, data, ttl_seconds=ttl_seconds, stale_ttl_seconds=stale_ttl_seconds,
+                      tags=entry_tags)
+        return data
+    
+    return in_flight.do(flight_key, load)
 
-def get_match_history(player_id, limit=20, use_cache=True):
+def get_player_id(nickname, use_cache=True):
     if not API_KEY:
+        print("Erro de API: A chave não foi carregada.")
         return None
     
-    cache_key = f"{player_id}_{limit}"
-    if use_cache:
-        cached_data = cache.get("match_history", cache_key)
-        if cached_data is not None:
-            return cached_data
+    def fetch():
+        url = f"{API_BASE_URL}/players"
+        params = {"nickname": nickname} 
         
-    url = f"https://open.faceit.com/data/v4/players/{player_id}/history"
-    headers = {"Authorization": f"Bearer {API_KEY}"}
+        try:
+            response = http_client.get(url, params=params, endpoint="/players")
+            return _parse_player_data(nickname, response.json())
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching player ID for {nickname}: {e}")
+            return None
+    
+    return _cached_fetch("player_id", nickname.lower(), fetch, CACHE_PLAYER_ID_TTL, use_cache,
+                         stale_ttl_seconds=CACHE_PLAYER_ID_STALE_TTL,
+                         tags=lambda data: [player_tag(data["player_id"])])
+
+def _fetch_history_page(player_id, offset, limit, since=None):
+    url = f"{API_BASE_URL}/players/{player_id}/history"
     params = {
         "game": "cs2",
-        "offset": "0",
+        "offset": str(offset),
         "limit": str(limit)
     }
+    if since:
+        params["from"] = str(since)
     
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json().get("items", [])
+    response = http_client.get(url, params=params, endpoint="/players/{player_id}/history")
+    return response.json().get("items", [])
+
+def _history_window(items, page, requested):
+    known_ids = {match.get("match_id") for match in items}
+    return {
+        "items": items + [match for match in page if match.get("match_id") not in known_ids],
+        "exhausted": len(page) < requested
+    }
+
+def _fetch_history_tail(player_id, window, limit):
+    missing = limit - len(window["items"])
+    page = _fetch_history_page(player_id, len(window["items"]), missing)
+    return _history_window(window["items"], page, missing)
+
+def _sync_match_history(player_id, limit):
+    state = cache.get("match_history_sync", player_id)
+    
+    if not state:
+        window = _history_window([], _fetch_history_page(player_id, 0, limit), limit)
+    else:
+        window_size = max(limit, len(state["items"]))
+        known_ids = {match.get("match_id") for match in state["items"]}
+        new_items = []
+        reached_known = False
+        offset = 0
         
-        if use_cache:
-            cache.set("match_history", cache_key, data, ttl_seconds=CACHE_MATCH_HISTORY_TTL)
+        while True:
+            page = _fetch_history_page(player_id, offset, MATCH_HISTORY_SYNC_PAGE_SIZE, since=state["newest_finished_at"])
+            fresh = [match for match in page if match.get("match_id") not in known_ids]
+            new_items.extend(fresh)
+            
+            if len(fresh) < len(page):
+                reached_known = True
+                break
+            if len(page) < MATCH_HISTORY_SYNC_PAGE_SIZE or len(new_items) >= window_size:
+                break
+            offset += len(page)
         
-        return data
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching match history: {e}")
-        return None
+        if reached_known or len(new_items) < window_size:
+            exhausted = state.get("exhausted", False)
+            items = new_items + state["items"]
+            window = {"items": items if exhausted else items[:len(state["items"])], "exhausted": exhausted}
+        else:
+            window = {"items": new_items, "exhausted": False}
+        
+        if len(window["items"]) < limit and not window["exhausted"]:
+            window = _fetch_history_tail(player_id, window, limit)
+    
+    items = window["items"]
+    if items:
+        cache.set("match_history_sync", player_id, {
+            "items": items,
+            "exhausted": window["exhausted"],
+            "newest_match_id": items[0].get("match_id"),
+            "newest_finished_at": max((match.get("finished_at") or 0) for match in items)
+        }, ttl_seconds=CACHE_MATCH_HISTORY_SYNC_TTL)
+    
+    return window
 
-def get_player_matches(player_id, limit=20, use_cache=True):
-    matches = get_match_history(player_id, limit, use_cache)
-    if not matches:
+def get_match_history(player_id, limit=20, use_cache=True, incremental=None):
+    if not API_KEY:
         return None
+    
+    if incremental is None:
+        incremental = MATCH_HISTORY_INCREMENTAL_SYNC
+    
+    def fetch(window_size, window=None):
+        try:
+            if incremental and use_cache:
+                return _sync_match_history(player_id, window_size)
+            if window:
+                return _fetch_history_tail(player_id, window, window_size)
+            return _history_window([], _fetch_history_page(player_id, 0, window_size), window_size)
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching match history: {e}")
+            return None
+    
+    if not use_cache:
+        window = fetch(limit)
+        return window["items"] if window is not None else None
+    
+    flight_key = f"match_history:{player_id}"
+    
+    def load(min_size, background=False):
+        current = cache.peek("match_history", player_id)
+        if not background and current is not None and (len(current["items"]) >= min_size or current["exhausted"]):
+            return current
         
-    detailed_matches = []
-    for match in matches:
-        match_id = match.get("match_id")
-        match_stats = get_match_stats(match_id, use_cache)
+        window_size = max(min_size, len(current["items"])) if current else min_size
+        started_at = time.perf_counter()
+        window = fetch(window_size, None if background else current)
+        if not background:
+            cache.record_fill("match_history", time.perf_counter() - started_at)
+        if window is None:
+            return None
+        
+        latest = cache.peek("match_history", player_id)
+        if latest is not None and len(window["items"]) < len(latest["items"]):
+            return latest
+        cache.set("match_history", player_id, window, ttl_seconds=CACHE_MATCH_HISTORY_TTL,
+                  stale_ttl_seconds=CACHE_MATCH_HISTORY_STALE_TTL, tags=[player_tag(player_id)])
+        return window
+    
+    def refresh():
+        in_flight.do(flight_key, lambda: load(limit, background=True))
+    
+    cached_window = cache.get("match_history", player_id, refresh=refresh)
+    if cached_window is not None and (len(cached_window["items"]) >= limit or cached_window["exhausted"]):
+        return cached_window["items"][:limit]
+    
+    while True:
+        window = in_flight.do(flight_key, lambda: load(limit))
+        if window is None or len(window["items"]) >= limit or window["exhausted"]:
+            break
+    return window["items"][:limit] if window is not None else None
+
+def _project_match_stats(rounds):
+    if not rounds:
+        return {}
+    
+    first_round = rounds[0]
+    rounds_map = None
+    for round_data in rounds:
+        round_stats = round_data.get("round_stats", {})
+        if round_stats:
+            rounds_map = round_stats.get("Map") or round_stats.get("map")
+            if rounds_map:
+                break
+    
+    teams = {}
+    players = {}
+    for index, team in enumerate(first_round.get("teams", [])):
+        team_key = team.get("team_id") or str(index)
+        teams[team_key] = team.get("team_stats", {}).get("Team Win") or team.get("Result")
+        for player in team.get("players", []):
+            stats = player.get("player_stats", {})
+            players[player.get("player_id")] = (team_key, tuple(stats.get(key) for key in SLIM_PLAYER_STAT_KEYS))
+    
+    return {
+        "map": first_round.get("round_stats", {}).get("Map") or first_round.get("Map"),
+        "rounds_map": rounds_map,
+        "date": first_round.get("round_stats", {}).get("Date") or first_round.get("Date"),
+        "teams": teams,
+        "players": players
+    }
+
+def _expand_player_stats(stat_vector):
+    return {key: value for key, value in zip(SLIM_PLAYER_STAT_KEYS, stat_vector) if value is not None}
+
+def _build_match_entry(match, match_stats, player_id):
+    match_id = match.get("match_id")
+    
+    if match_stats:
+        player_stats = None
+        player_team_result = None
         
-        if match_stats and len(match_stats) > 0:
-            player_stats = None
-            player_team_result = None
+        player_row = match_stats.get("players", {}).get(player_id)
+        if player_row:
+            team_key, stat_vector = player_row
+            player_stats = _expand_player_stats(stat_vector)
+            player_team_result = match_stats.get("teams", {}).get(team_key)
+        
+        if player_stats:
+            map_name = None
+            map_name = match.get("game_map_name") or match.get("i18n")
             
-            for team in match_stats[0].get("teams", []):
-                for player in team.get("players", []):
-                    if player.get("player_id") == player_id:
-                        player_stats = player.get("player_stats", {})
-                        player_team_result = team.get("team_stats", {}).get("Team Win") or team.get("Result")
-                        break
-                if player_stats:
-                    break
+            if not map_name:
+                map_obj = match.get("map")
+                if isinstance(map_obj, dict):
+                    map_name = map_obj.get("name") or map_obj.get("i18n") or map_obj.get("game_map_name")
+                elif isinstance(map_obj, str):
+                    map_name = map_obj
+            
+            if not map_name:
+                map_name = match_stats.get("map")
+            
+            if not map_name:
+                voting = match.get("voting", {})
+                if voting:
+                    map_voting = voting.get("map", {})
+                    if isinstance(map_voting, dict):
+                        map_name = map_voting.get("name") or map_voting.get("i18n")
+                    elif isinstance(map_voting, str):
+                        map_name = map_voting
+            
+            if not map_name:
+                map_name = match.get("competition_name")
+            
+            if not map_name:
+                map_name = match_stats.get("rounds_map")
+            
+            if not map_name or map_name == "Unknown":
+                map_name = "N/A"
             
-            if player_stats:
-                map_name = None
-                map_name = match.get("game_map_name") or match.get("i18n")
-                
-                if not map_name:
-                    map_obj = match.get("map")
-                    if isinstance(map_obj, dict):
-                        map_name = map_obj.get("name") or map_obj.get("i18n") or map_obj.get("game_map_name")
-                    elif isinstance(map_obj, str):
-                        map_name = map_obj
-                
-                if not map_name and match_stats and len(match_stats) > 0:
-                    map_name = match_stats[0].get("round_stats", {}).get("Map") or match_stats[0].get("Map")
-                
-                if not map_name:
-                    voting = match.get("voting", {})
-                    if voting:
-                        map_voting = voting.get("map", {})
-                        if isinstance(map_voting, dict):
-                            map_name = map_voting.get("name") or map_voting.get("i18n")
-                        elif isinstance(map_voting, str):
-                            map_name = map_voting
-                
-                if not map_name:
-                    map_name = match.get("competition_name")
-                
-                if not map_name and match_stats and len(match_stats) > 0:
-                    for round_data in match_stats:
-                        round_stats = round_data.get("round_stats", {})
-                        if round_stats:
-                            map_name = round_stats.get("Map") or round_stats.get("map")
-                            if map_name:
-                                break
-                
-                if not map_name or map_name == "Unknown":
-                    map_name = "N/A"
-                
-                result = match.get("game_result")
-                if not result:
-                    result = match.get("result")
-                if not result:
-                    result = player_team_result
-                if not result:
-                    factions = match.get("factions", {})
-                    if factions:
-                        for faction in factions.values():
-                            if player_id in [p.get("player_id") for p in faction.get("players", [])]:
-                                result = faction.get("stats", {}).get("score") or "Unknown"
-                                break
-                
-                if not result:
-                    team_stats = match_stats[0].get("teams", [])
-                    for team in team_stats:
-                        for p in team.get("players", []):
-                            if p.get("player_id") == player_id:
-                                team_result = team.get("team_stats", {}).get("Team Win")
-                                if team_result:
-                                    result = "1" if team_result == "1" else "0"
-                                break
-                
-                started_at = None
-                started_at = match.get("started_at")
-                
-                if not started_at:
-                    started_at = match.get("finished_at")
-                if not started_at:
-                    started_at = match.get("date")
-                if not started_at:
-                    started_at = match.get("created_at")
-                if not started_at and match_stats and len(match_stats) > 0:
-                    started_at = match_stats[0].get("round_stats", {}).get("Date") or match_stats[0].get("Date")
-                if not started_at:
-                    for key in ["timestamp", "time", "match_date", "game_date"]:
-                        if match.get(key):
-                            started_at = match.get(key)
+            result = match.get("game_result")
+            if not result:
+                result = match.get("result")
+            if not result:
+                result = player_team_result
+            if not result:
+                factions = match.get("factions", {})
+                if factions:
+                    for faction in factions.values():
+                        if player_id in [p.get("player_id") for p in faction.get("players", [])]:
+                            result = faction.get("stats", {}).get("score") or "Unknown"
                             break
-                
-                if not started_at:
-                    started_at = ""
-                elif isinstance(started_at, (int, float)):
-                    pass
-                elif not isinstance(started_at, str):
-                    started_at = str(started_at) if started_at else ""
-                
-                detailed_matches.append({
-                    "match_id": match_id,
-                    "map": map_name if map_name else "N/A",
-                    "date": started_at if started_at else "",
-                    "started_at": match.get("started_at", ""),
-                    "finished_at": match.get("finished_at", ""),
-                    "result": result or "Unknown",
-                    "score": match.get("score", "Unknown"),
-                    "stats": player_stats,
-                })
-                
-    return detailed_matches
+            
+            started_at = None
+            started_at = match.get("started_at")
+            
+            if not started_at:
+                started_at = match.get("finished_at")
+            if not started_at:
+                started_at = match.get("date")
+            if not started_at:
+                started_at = match.get("created_at")
+            if not started_at:
+                started_at = match_stats.get("date")
+            if not started_at:
+                for key in ["timestamp", "time", "match_date", "game_date"]:
+                    if match.get(key):
+                        started_at = match.get(key)
+                        break
+            
+            if not started_at:
+                started_at = ""
+            elif isinstance(started_at, (int, float)):
+                pass
+            elif not isinstance(started_at, str):
+                started_at = str(started_at) if started_at else ""
+            
+            return {
+                "match_id": match_id,
+                "map": map_name if map_name else "N/A",
+                "date": started_at if started_at else "",
+                "started_at": match.get("started_at", ""),
+                "finished_at": match.get("finished_at", ""),
+                "result": result or "Unknown",
+                "score": match.get("score", "Unknown"),
+                "stats": player_stats,
+            }
+    
+    return None
 
-def get_match_stats(match_id, use_cache=True):
-    if not API_KEY:
+def get_player_matches(player_id, limit=20, use_cache=True, max_workers=None):
+    matches = get_match_history(player_id, limit, use_cache)
+    if not matches:
         return None
     
-    if use_cache:
-        cached_data = cache.get("match_stats", match_id)
-        if cached_data is not None:
-            return cached_data
-        
-    url = f"https://open.faceit.com/data/v4/matches/{match_id}/stats"
-    headers = {"Authorization": f"Bearer {API_KEY}"}
+    return build_player_matches(player_id, matches, use_cache, max_workers)
+
+def build_player_matches(player_id, matches, use_cache=True, max_workers=None):
+    if max_workers is None:
+        max_workers = API_MAX_WORKERS
+    
+    match_ids = [match.get("match_id") for match in matches]
+    if max_workers > 1 and len(match_ids) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(match_ids))) as executor:
+            all_stats = list(executor.map(lambda match_id: get_match_summary(match_id, use_cache), match_ids))
+    else:
+        all_stats = [get_match_summary(match_id, use_cache) for match_id in match_ids]
+    
+    detailed_matches = []
+    for match, match_stats in zip(matches, all_stats):
+        entry = _build_match_entry(match, match_stats, player_id)
+        if entry:
+            detailed_matches.append(entry)
+    
+    return detailed_matches
+
+def _fetch_match_rounds(match_id):
+    url = f"{API_BASE_URL}/matches/{match_id}/stats"
     
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        result = data.get("rounds", [])
-        
-        if use_cache:
-            cache.set("match_stats", match_id, result, ttl_seconds=CACHE_MATCH_STATS_TTL)
-        
-        return result
+        response = http_client.get(url, endpoint="/matches/{match_id}/stats")
+        return response.json().get("rounds", [])
     except requests.exceptions.RequestException as e:
         print(f"Error fetching match stats for match {match_id}: {e}")
         return None
 
+def get_match_stats(match_id, use_cache=True):
+    if not API_KEY:
+        return None
+    
+    return _cached_fetch("match_rounds", match_id, lambda: _fetch_match_rounds(match_id), CACHE_MATCH_STATS_TTL,
+                         use_cache)
+
+def get_match_summary(match_id, use_cache=True):
+    if not API_KEY:
+        return None
+    
+    def fetch():
+        rounds = _fetch_match_rounds(match_id)
+        return _project_match_stats(rounds) if rounds is not None else None
+    
+    return _cached_fetch("match_stats", match_id, fetch, CACHE_MATCH_STATS_TTL, use_cache)
+
 def get_player_stats(player_id, use_cache=True):
     if not API_KEY:
         return None
     
-    if use_cache:
-        cached_data = cache.get("player_stats", player_id)
-        if cached_data is not None:
-            return cached_data
+    def fetch():
+        url = f"{API_BASE_URL}/players/{player_id}/stats/cs2"
         
-    url = f"https://open.faceit.com/data/v4/players/{player_id}/stats/cs2"
-    headers = {"Authorization": f"Bearer {API_KEY}"}
+        try:
+            response = http_client.get(url, endpoint="/players/{player_id}/stats/cs2")
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching player stats: {e}")
+            return None
     
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        
-        if use_cache:
-            cache.set("player_stats", player_id, data, ttl_seconds=CACHE_PLAYER_STATS_TTL)
-        
-        return data
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching player stats: {e}")
-        return None
\ No newline at end of file
+    return _cached_fetch("player_stats", player_id, fetch, CACHE_PLAYER_STATS_TTL, use_cache,
+                         stale_ttl_seconds=CACHE_PLAYER_STATS_STALE_TTL, tags=[player_tag(player_id)])
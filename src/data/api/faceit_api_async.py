@@ -0,0 +1,272 @@
+import asyncio
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import aiohttp
+
+root_dir = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.data.cache.cache_manager import get_cache
+from src.data.cache.single_flight import AsyncSingleFlight
+from src.data.api import faceit_api
+from src.data.api.faceit_api import _parse_player_data, _project_match_stats, _build_match_entry, _history_window, player_tag
+from config.settings import (
+    CACHE_PLAYER_ID_TTL,
+    CACHE_MATCH_HISTORY_TTL,
+    CACHE_MATCH_STATS_TTL,
+    CACHE_PLAYER_ID_STALE_TTL,
+    CACHE_MATCH_HISTORY_STALE_TTL,
+    API_CONNECT_TIMEOUT,
+    API_READ_TIMEOUT,
+    API_MAX_RETRIES,
+    API_BACKOFF_BASE,
+    API_BACKOFF_MAX,
+    API_ASYNC_MAX_CONCURRENCY,
+    API_RATE_LIMIT_MAX_RETRIES
+)
+from src.data.api.rate_limiter import RateLimiter, get_rate_limiter, parse_retry_after
+from src.data.api.telemetry import ApiTelemetry, endpoint_label, get_api_telemetry
+
+cache = get_cache(ttl_seconds=3600)
+in_flight = AsyncSingleFlight()
+
+class AsyncFaceitClient:
+    def __init__(self, max_concurrency: int = API_ASYNC_MAX_CONCURRENCY,
+                 connect_timeout: float = API_CONNECT_TIMEOUT, read_timeout: float = API_READ_TIMEOUT,
+                 max_retries: int = API_MAX_RETRIES, backoff_base: float = API_BACKOFF_BASE,
+                 backoff_max: float = API_BACKOFF_MAX,
+                 max_rate_limit_retries: int = API_RATE_LIMIT_MAX_RETRIES,
+                 rate_limiter: Optional[RateLimiter] = None, telemetry: Optional[ApiTelemetry] = None):
+        self.max_concurrency = max_concurrency
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.telemetry = telemetry or get_api_telemetry()
+        self.session: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self) -> "AsyncFaceitClient":
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            headers={"Authorization": f"Bearer {faceit_api.API_KEY}"}
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, delay)
+    
+    async def get_json(self, url: str, params: Optional[Dict[str, str]] = None, endpoint: Optional[str] = None) -> Any:
+        endpoint = endpoint or endpoint_label(url)
+        attempt = 0
+        throttled_attempts = 0
+        while True:
+            await self.rate_limiter.acquire_async()
+            started_at = time.perf_counter()
+            try:
+                async with self.session.get(url, params=params) as response:
+                    self.telemetry.record(endpoint, response.status, time.perf_counter() - started_at)
+                    if response.status == 429 and throttled_attempts < self.max_rate_limit_retries:
+                        self.rate_limiter.penalize(parse_retry_after(response.headers.get("Retry-After")))
+                        throttled_attempts += 1
+                        continue
+                    if response.status < 500 or attempt >= self.max_retries:
+                        response.raise_for_status()
+                        return await response.json()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                self.telemetry.record(endpoint, type(e).__name__, time.perf_counter() - started_at)
+                if attempt >= self.max_retries:
+                    raise
+            
+            await asyncio.sleep(self._backoff_delay(attempt))
+            attempt += 1
+
+async def _with_client(client: Optional[AsyncFaceitClient], call):
+    if client is not None:
+        return await call(client)
+    async with AsyncFaceitClient() as own_client:
+        return await call(own_client)
+
+async def _cached_fetch(prefix, identifier, fetch, ttl_seconds, use_cache=True, stale_ttl_seconds=None, tags=None):
+    if use_cache:
+        cached_data = cache.get(prefix, identifier)
+        if cached_data is not None:
+            return cached_data
+    
+    async def load():
+        started_at = time.perf_counter()
+        data = await fetch()
+        cache.record_fill(prefix, time.perf_counter() - started_at)
+        if use_cache and data is not None:
+            entry_tags = tags(data) if callable(tags) else tags
+            await asyncio.to_thread(cache.set, prefix, identifier, data, ttl_seconds=ttl_seconds,
+                                    stale_ttl_seconds=stale_ttl_seconds, tags=entry_tags)
+        return data
+    
+    return await in_flight.do(f"{prefix}:{identifier}", load)
+
+async def get_player_id(nickname, use_cache=True, client=None):
+    if not faceit_api.API_KEY:
+        print("Erro de API: A chave não foi carregada.")
+        return None
+    
+    async def fetch():
+        url = f"{faceit_api.API_BASE_URL}/players"
+        params = {"nickname": nickname}
+        
+        try:
+            data = await _with_client(client, lambda c: c.get_json(url, params=params, endpoint="/players"))
+            return _parse_player_data(nickname, data)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching player ID for {nickname}: {e}")
+            return None
+    
+    return await _cached_fetch("player_id", nickname.lower(), fetch, CACHE_PLAYER_ID_TTL, use_cache,
+                               stale_ttl_seconds=CACHE_PLAYER_ID_STALE_TTL,
+                               tags=lambda data: [player_tag(data["player_id"])])
+
+async def get_match_history(player_id, limit=20, use_cache=True, client=None):
+    if not faceit_api.API_KEY:
+        return None
+    
+    cached_window = cache.get("match_history", player_id) if use_cache else None
+    if cached_window is not None and (len(cached_window["items"]) >= limit or cached_window["exhausted"]):
+        return cached_window["items"][:limit]
+    
+    async def fetch():
+        started_at = time.perf_counter()
+        items = cached_window["items"] if cached_window else []
+        url = f"{faceit_api.API_BASE_URL}/players/{player_id}/history"
+        params = {
+            "game": "cs2",
+            "offset": str(len(items)),
+            "limit": str(limit - len(items))
+        }
+        
+        try:
+            data = await _with_client(
+                client, lambda c: c.get_json(url, params=params, endpoint="/players/{player_id}/history")
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching match history: {e}")
+            return None
+        
+        window = _history_window(items, data.get("items", []), limit - len(items))
+        cache.record_fill("match_history", time.perf_counter() - started_at)
+        if use_cache:
+            latest = cache.peek("match_history", player_id)
+            if latest is not None and len(window["items"]) < len(latest["items"]):
+                return latest
+            cache.set("match_history", player_id, window, ttl_seconds=CACHE_MATCH_HISTORY_TTL,
+                      stale_ttl_seconds=CACHE_MATCH_HISTORY_STALE_TTL, tags=[player_tag(player_id)])
+        return window
+    
+    window = await in_flight.do(f"match_history:{player_id}:{limit}", fetch)
+    return window["items"][:limit] if window is not None else None
+
+async def _fetch_match_rounds(match_id, client=None):
+    url = f"{faceit_api.API_BASE_URL}/matches/{match_id}/stats"
+    
+    try:
+        data = await _with_client(client, lambda c: c.get_json(url, endpoint="/matches/{match_id}/stats"))
+        return data.get("rounds", [])
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"Error fetching match stats for match {match_id}: {e}")
+        return None
+
+async def get_match_stats(match_id, use_cache=True, client=None):
+    if not faceit_api.API_KEY:
+        return None
+    
+    return await _cached_fetch("match_rounds", match_id, lambda: _fetch_match_rounds(match_id, client),
+                               CACHE_MATCH_STATS_TTL, use_cache)
+
+async def get_match_summary(match_id, use_cache=True, client=None):
+    if not faceit_api.API_KEY:
+        return None
+    
+    async def fetch():
+        rounds = await _fetch_match_rounds(match_id, client)
+        return _project_match_stats(rounds) if rounds is not None else None
+    
+    return await _cached_fetch("match_stats", match_id, fetch, CACHE_MATCH_STATS_TTL, use_cache)
+
+async def get_player_matches(player_id, limit=20, use_cache=True, client=None):
+    async def fetch(c):
+        matches = await get_match_history(player_id, limit, use_cache, client=c)
+        if not matches:
+            return None
+        
+        all_stats = await asyncio.gather(*(
+            get_match_summary(match.get("match_id"), use_cache, client=c) for match in matches
+        ))
+        
+        detailed_matches = []
+        for match, match_stats in zip(matches, all_stats):
+            entry = _build_match_entry(match, match_stats, player_id)
+            if entry:
+                detailed_matches.append(entry)
+        return detailed_matches
+    
+    return await _with_client(client, fetch)
+
+async def get_player_ids_batch(nicknames: Iterable[str], use_cache: bool = True,
+                               max_concurrency: int = API_ASYNC_MAX_CONCURRENCY) -> Dict[str, Optional[Dict]]:
+    nicknames = list(nicknames)
+    async with AsyncFaceitClient(max_concurrency=max_concurrency) as client:
+        results = await asyncio.gather(*(get_player_id(nickname, use_cache, client=client) for nickname in nicknames))
+    return dict(zip(nicknames, results))
+
+async def get_player_matches_batch(player_ids: Iterable[str], limit: int = 20, use_cache: bool = True,
+                                   max_concurrency: int = API_ASYNC_MAX_CONCURRENCY) -> Dict[str, Optional[List[Dict]]]:
+    player_ids = list(player_ids)
+    async with AsyncFaceitClient(max_concurrency=max_concurrency) as client:
+        results = await asyncio.gather(*(get_player_matches(player_id, limit, use_cache, client=client) for player_id in player_ids))
+    return dict(zip(player_ids, results))
+
+def run_sync(coro):
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    outcome: Dict[str, Any] = {}
+    
+    def runner():
+        try:
+            outcome["result"] = asyncio.run(coro)
+        except BaseException as e:
+            outcome["error"] = e
+    
+    thread = threading.Thread(target=runner)
+    thread.start()
+    thread.join()
+    
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+def get_player_ids_batch_sync(nicknames: Iterable[str], use_cache: bool = True,
+                              max_concurrency: int = API_ASYNC_MAX_CONCURRENCY) -> Dict[str, Optional[Dict]]:
+    return run_sync(get_player_ids_batch(nicknames, use_cache, max_concurrency))
+
+def get_player_matches_batch_sync(player_ids: Iterable[str], limit: int = 20, use_cache: bool = True,
+                                  max_concurrency: int = API_ASYNC_MAX_CONCURRENCY) -> Dict[str, Optional[List[Dict]]]:
+    return run_sync(get_player_matches_batch(player_ids, limit, use_cache, max_concurrency))
@@ -0,0 +1,91 @@
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+root_dir = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+from config.settings import (
+    API_CONNECT_TIMEOUT,
+    API_READ_TIMEOUT,
+    API_MAX_RETRIES,
+    API_BACKOFF_BASE,
+    API_BACKOFF_MAX,
+    API_POOL_SIZE,
+    API_RATE_LIMIT_MAX_RETRIES
+)
+from src.data.api.rate_limiter import RateLimiter, get_rate_limiter, parse_retry_after
+from src.data.api.telemetry import ApiTelemetry, endpoint_label, get_api_telemetry
+
+class FaceitHttpClient:
+    def __init__(self, connect_timeout: float = API_CONNECT_TIMEOUT, read_timeout: float = API_READ_TIMEOUT,
+                 max_retries: int = API_MAX_RETRIES, backoff_base: float = API_BACKOFF_BASE,
+                 backoff_max: float = API_BACKOFF_MAX, pool_size: int = API_POOL_SIZE,
+                 max_rate_limit_retries: int = API_RATE_LIMIT_MAX_RETRIES,
+                 rate_limiter: Optional[RateLimiter] = None, telemetry: Optional[ApiTelemetry] = None):
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.telemetry = telemetry or get_api_telemetry()
+        self.api_key: Optional[str] = None
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+    
+    def set_api_key(self, api_key: str) -> None:
+        self.api_key = api_key
+        self.session.headers["Authorization"] = f"Bearer {api_key}"
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, delay)
+    
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            timeout: Optional[Tuple[float, float]] = None, endpoint: Optional[str] = None) -> requests.Response:
+        endpoint = endpoint or endpoint_label(url)
+        attempt = 0
+        throttled_attempts = 0
+        while True:
+            self.rate_limiter.acquire()
+            started_at = time.perf_counter()
+            try:
+                response = self.session.get(url, params=params, timeout=timeout or self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                self.telemetry.record(endpoint, type(e).__name__, time.perf_counter() - started_at)
+                if attempt >= self.max_retries:
+                    raise
+            else:
+                self.telemetry.record(endpoint, response.status_code, time.perf_counter() - started_at)
+                if response.status_code == 429 and throttled_attempts < self.max_rate_limit_retries:
+                    self.rate_limiter.penalize(parse_retry_after(response.headers.get("Retry-After")))
+                    response.close()
+                    throttled_attempts += 1
+                    continue
+                if response.status_code < 500 or attempt >= self.max_retries:
+                    response.raise_for_status()
+                    return response
+                response.close()
+            
+            time.sleep(self._backoff_delay(attempt))
+            attempt += 1
+    
+    def close(self) -> None:
+        self.session.close()
+
+_client_instance: Optional[FaceitHttpClient] = None
+
+def get_http_client() -> FaceitHttpClient:
+    global _client_instance
+    if _client_instance is None:
+        _client_instance = FaceitHttpClient()
+    return _client_instance
@@ -0,0 +1,117 @@
+import asyncio
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+root_dir = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+from config.settings import (
+    API_RATE_LIMIT_PER_SECOND,
+    API_RATE_LIMIT_BURST,
+    API_RATE_LIMIT_DEFAULT_RETRY_AFTER
+)
+
+class RateLimiter:
+    def __init__(self, rate_per_second: float = API_RATE_LIMIT_PER_SECOND, burst: int = API_RATE_LIMIT_BURST):
+        self.rate = float(rate_per_second)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        
+        self._waiting = 0
+        self.total_requests = 0
+        self.throttled_requests = 0
+        self.total_throttle_seconds = 0.0
+        self.rate_limited_responses = 0
+    
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            if now > self._last:
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+            
+            self._tokens -= 1
+            delay = self._last - now
+            if self._tokens < 0:
+                delay += -self._tokens / self.rate
+            
+            self.total_requests += 1
+            if delay > 0:
+                self.throttled_requests += 1
+                self.total_throttle_seconds += delay
+                self._waiting += 1
+            return delay
+    
+    def _release_waiter(self) -> None:
+        with self._lock:
+            self._waiting -= 1
+    
+    def acquire(self) -> float:
+        delay = self._reserve()
+        if delay > 0:
+            try:
+                time.sleep(delay)
+            finally:
+                self._release_waiter()
+        return delay
+    
+    async def acquire_async(self) -> float:
+        delay = self._reserve()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._release_waiter()
+        return delay
+    
+    def penalize(self, retry_after_seconds: float) -> None:
+        with self._lock:
+            resume_at = time.monotonic() + max(0.0, retry_after_seconds)
+            self._last = max(self._last, resume_at)
+            self._tokens = min(self._tokens, 0.0)
+            self.rate_limited_responses += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'rate_per_second': self.rate,
+                'burst': self.burst,
+                'queue_depth': self._waiting,
+                'total_requests': self.total_requests,
+                'throttled_requests': self.throttled_requests,
+                'total_throttle_seconds': round(self.total_throttle_seconds, 3),
+                'rate_limited_responses': self.rate_limited_responses
+            }
+
+def parse_retry_after(value: Optional[str], default: float = API_RATE_LIMIT_DEFAULT_RETRY_AFTER) -> float:
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+_limiter_instance: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+def get_rate_limiter() -> RateLimiter:
+    global _limiter_instance
+    if _limiter_instance is None:
+        with _limiter_lock:
+            if _limiter_instance is None:
+                _limiter_instance = RateLimiter()
+    return _limiter_instance
@@ -0,0 +1,93 @@
+import sys
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+from urllib.parse import urlparse
+
+root_dir = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+from config.settings import API_LATENCY_BUCKETS_MS
+
+class ApiTelemetry:
+    def __init__(self, buckets_ms: Iterable[float] = API_LATENCY_BUCKETS_MS):
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+    
+    def record(self, endpoint: str, status: Union[int, str], seconds: float) -> None:
+        elapsed_ms = seconds * 1000
+        bucket = bisect_left(self.buckets_ms, elapsed_ms)
+        
+        with self._lock:
+            metrics = self._endpoints.get(endpoint)
+            if metrics is None:
+                metrics = self._endpoints[endpoint] = {
+                    'count': 0,
+                    'total_ms': 0.0,
+                    'max_ms': 0.0,
+                    'buckets': [0] * (len(self.buckets_ms) + 1),
+                    'status_codes': {}
+                }
+            metrics['count'] += 1
+            metrics['total_ms'] += elapsed_ms
+            metrics['max_ms'] = max(metrics['max_ms'], elapsed_ms)
+            metrics['buckets'][bucket] += 1
+            metrics['status_codes'][str(status)] = metrics['status_codes'].get(str(status), 0) + 1
+    
+    def _bucket_labels(self):
+        labels = [f"<={bound:g}ms" for bound in self.buckets_ms]
+        labels.append(f">{self.buckets_ms[-1]:g}ms" if self.buckets_ms else "all")
+        return labels
+    
+    def _percentile(self, buckets, count: int, fraction: float) -> Optional[float]:
+        if not count:
+            return None
+        threshold = count * fraction
+        seen = 0
+        for index, bucket_count in enumerate(buckets):
+            seen += bucket_count
+            if seen >= threshold:
+                return self.buckets_ms[index] if index < len(self.buckets_ms) else None
+        return None
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        labels = self._bucket_labels()
+        with self._lock:
+            snapshot = {
+                endpoint: dict(metrics, buckets=list(metrics['buckets']), status_codes=dict(metrics['status_codes']))
+                for endpoint, metrics in self._endpoints.items()
+            }
+        
+        stats = {}
+        for endpoint, metrics in sorted(snapshot.items()):
+            count = metrics['count']
+            stats[endpoint] = {
+                'count': count,
+                'avg_ms': round(metrics['total_ms'] / count, 1) if count else None,
+                'max_ms': round(metrics['max_ms'], 1),
+                'p50_ms': self._percentile(metrics['buckets'], count, 0.5),
+                'p95_ms': self._percentile(metrics['buckets'], count, 0.95),
+                'histogram': dict(zip(labels, metrics['buckets'])),
+                'status_codes': metrics['status_codes']
+            }
+        return stats
+    
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+def endpoint_label(url: str) -> str:
+    return urlparse(url).path or url
+
+_telemetry_instance: Optional[ApiTelemetry] = None
+_telemetry_lock = threading.Lock()
+
+def get_api_telemetry() -> ApiTelemetry:
+    global _telemetry_instance
+    if _telemetry_instance is None:
+        with _telemetry_lock:
+            if _telemetry_instance is None:
+                _telemetry_instance = ApiTelemetry()
+    return _telemetry_instance
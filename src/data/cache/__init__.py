@@ -2,6 +2,8 @@
 Módulo de cache para gerenciamento de dados em memória.
 """
 from .cache_manager import CacheManager, get_cache, clear_cache
+from .disk_cache import DiskCache
+from .single_flight import SingleFlight, AsyncSingleFlight, get_single_flight
 
-__all__ = ['CacheManager', 'get_cache', 'clear_cache']
+__all__ = ['CacheManager', 'get_cache', 'clear_cache', 'DiskCache', 'SingleFlight', 'AsyncSingleFlight', 'get_single_flight']
 
@@ -1,104 +1,586 @@
-from typing import Any, Optional, Dict
-from datetime import datetime, timedelta
+import heapq
+import itertools
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Dict, Iterable, Tuple
+
+root_dir = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(root_dir))
+
+from config.settings import (
+    CACHE_DISK_ENABLED,
+    CACHE_DISK_PATH,
+    CACHE_DISK_PRAGMAS,
+    CACHE_DISK_PREFIXES,
+    CACHE_COMPRESSION_MIN_BYTES,
+    CACHE_JANITOR_INTERVAL,
+    CACHE_MAX_MEMORY_MB,
+    CACHE_PREFIX_CODECS,
+    CACHE_PREFIX_MAX_MEMORY_MB,
+    CACHE_REFRESH_WORKERS,
+    CACHE_SHARDS
+)
+from src.data.cache.codecs import ValueCodec, get_codec
+from src.data.cache.disk_cache import DiskCache
+
+def estimate_size_bytes(value: Any) -> int:
+    seen = set()
+    total = 0
+    stack = [value]
+    
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    
+    return total
+
+class _CacheShard:
+    def __init__(self, max_bytes: Optional[int], prefix_max_bytes: Dict[str, int]):
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_bytes = max_bytes
+        self.prefix_max_bytes = prefix_max_bytes
+        capped_bytes = sum(prefix_max_bytes.values())
+        scale = min(1.0, max_bytes / capped_bytes) if max_bytes and capped_bytes else 1.0
+        self.prefix_share_bytes = {prefix: int(limit * scale) for prefix, limit in prefix_max_bytes.items()}
+        self.prefix_keys: Dict[str, "OrderedDict[str, None]"] = {}
+        self.prefix_bytes: Dict[str, int] = {}
+        self.tag_keys: Dict[str, set] = {}
+        self.prefix_counters: Dict[str, Dict[str, int]] = {}
+        self.codec_counters: Dict[str, Dict[str, float]] = {}
+        self.total_bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+    
+    def count(self, prefix: str, counter: str) -> None:
+        counters = self.prefix_counters.get(prefix)
+        if counters is None:
+            counters = self.prefix_counters[prefix] = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+        counters[counter] += 1
+    
+    def count_codec(self, prefix: str, **amounts: float) -> None:
+        counters = self.codec_counters.get(prefix)
+        if counters is None:
+            counters = self.codec_counters[prefix] = {
+                'encodes': 0, 'encode_seconds': 0.0, 'raw_bytes': 0, 'encoded_bytes': 0,
+                'decodes': 0, 'decode_seconds': 0.0
+            }
+        for name, amount in amounts.items():
+            counters[name] += amount
+    
+    def lookup(self, prefix: str, key: str, now: float) -> Optional[Dict[str, Any]]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.count(prefix, 'misses')
+            return None
+        
+        if now >= entry['expires_at']:
+            self.remove(key)
+            self.expirations += 1
+            self.count(prefix, 'expirations')
+            self.count(prefix, 'misses')
+            return None
+        
+        self.entries.move_to_end(key)
+        self.prefix_keys[prefix].move_to_end(key)
+        self.count(prefix, 'hits')
+        return entry
+    
+    def remove(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        
+        prefix = entry['prefix']
+        self.prefix_keys[prefix].pop(key, None)
+        self.prefix_bytes[prefix] -= entry['size']
+        self.total_bytes -= entry['size']
+        
+        for tag in entry['tags']:
+            keys = self.tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tag_keys[tag]
+    
+    def remove_prefix(self, prefix: str) -> None:
+        for key in list(self.prefix_keys.get(prefix, ())):
+            self.remove(key)
+    
+    def remove_tag(self, tag: str) -> List[str]:
+        keys = list(self.tag_keys.get(tag, ()))
+        for key in keys:
+            self.remove(key)
+        return keys
+    
+    def _over_share_prefix(self) -> Optional[str]:
+        for prefix, share in self.prefix_share_bytes.items():
+            if self.prefix_bytes.get(prefix, 0) > share and self.prefix_keys.get(prefix):
+                return prefix
+        return None
+    
+    def _evict_oldest(self, prefix: Optional[str] = None) -> None:
+        if prefix is None:
+            key = next(iter(self.entries))
+        else:
+            key = next(iter(self.prefix_keys[prefix]))
+        self.count(self.entries[key]['prefix'], 'evictions')
+        self.remove(key)
+        self.evictions += 1
+    
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        self.remove(key)
+        
+        prefix = entry['prefix']
+        size = entry['size']
+        prefix_limit = self.prefix_max_bytes.get(prefix)
+        if (prefix_limit is not None and size > prefix_limit) or (self.max_bytes is not None and size > self.max_bytes):
+            return
+        
+        entry['seq'] = next(self._sequence)
+        self.entries[key] = entry
+        heapq.heappush(self._expiry_heap, (entry['expires_at'], entry['seq'], key))
+        self.prefix_keys.setdefault(prefix, OrderedDict())[key] = None
+        for tag in entry['tags']:
+            self.tag_keys.setdefault(tag, set()).add(key)
+        self.prefix_bytes[prefix] = self.prefix_bytes.get(prefix, 0) + size
+        self.total_bytes += size
+        
+        if prefix_limit is not None:
+            while self.prefix_bytes[prefix] > prefix_limit:
+                self._evict_oldest(prefix)
+        if self.max_bytes is not None:
+            while self.total_bytes > self.max_bytes:
+                victim = self._over_share_prefix()
+                if victim is None and prefix_limit is not None and len(self.prefix_keys[prefix]) > 1:
+                    victim = prefix
+                self._evict_oldest(victim)
+        
+        if len(self._expiry_heap) > 2 * len(self.entries) + 64:
+            self._compact_heap()
+    
+    def _compact_heap(self) -> None:
+        self._expiry_heap = [(entry['expires_at'], entry['seq'], key) for key, entry in self.entries.items()]
+        heapq.heapify(self._expiry_heap)
+    
+    def purge_expired(self, now: float) -> int:
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, seq, key = heapq.heappop(heap)
+            entry = self.entries.get(key)
+            if entry is not None and entry['seq'] == seq:
+                self.count(entry['prefix'], 'expirations')
+                self.remove(key)
+                removed += 1
+        self.expirations += removed
+        return removed
+    
+    def clear(self) -> None:
+        self.entries.clear()
+        self.prefix_keys.clear()
+        self.prefix_bytes.clear()
+        self.tag_keys.clear()
+        self.total_bytes = 0
+        self._expiry_heap = []
 
 class CacheManager:
-    def __init__(self, default_ttl_seconds: int = 3600):
-        self.cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, default_ttl_seconds: int = 3600, disk_cache: Optional[DiskCache] = None,
+                 persistent_prefixes: Optional[Iterable[str]] = None,
+                 max_memory_mb: Optional[float] = None,
+                 prefix_max_memory_mb: Optional[Dict[str, float]] = None,
+                 num_shards: int = CACHE_SHARDS,
+                 janitor_interval_seconds: Optional[float] = None,
+                 prefix_codecs: Optional[Dict[str, str]] = None,
+                 compression_min_bytes: int = 0):
         self.default_ttl = default_ttl_seconds
+        self.disk_cache = disk_cache
+        self.persistent_prefixes = set(persistent_prefixes or [])
+        self.codecs: Dict[str, ValueCodec] = {
+            prefix: get_codec(name) for prefix, name in (prefix_codecs or {}).items() if name
+        }
+        self.compression_min_bytes = compression_min_bytes
+        
+        num_shards = max(1, num_shards)
+        shard_max_bytes = int(max_memory_mb * 1024 * 1024 / num_shards) if max_memory_mb else None
+        shard_prefix_max_bytes = {
+            prefix: int(limit_mb * 1024 * 1024 / num_shards)
+            for prefix, limit_mb in (prefix_max_memory_mb or {}).items()
+        }
+        self._shards = [_CacheShard(shard_max_bytes, shard_prefix_max_bytes) for _ in range(num_shards)]
+        
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self.background_refreshes = 0
+        
+        self._metrics_lock = threading.Lock()
+        self._prefix_metrics: Dict[str, Dict[str, float]] = {}
+        
+        self._janitor_stop = threading.Event()
+        self._janitor: Optional[threading.Thread] = None
+        if janitor_interval_seconds:
+            self.start_janitor(janitor_interval_seconds)
+    
+    def start_janitor(self, interval_seconds: float) -> None:
+        if self._janitor is not None and self._janitor.is_alive():
+            return
+        self._janitor_stop.clear()
+        
+        def run_janitor():
+            while not self._janitor_stop.wait(interval_seconds):
+                try:
+                    self.cleanup_expired()
+                except Exception as e:
+                    print(f"Error cleaning up cache: {e}")
+        
+        self._janitor = threading.Thread(target=run_janitor, name="cache-janitor", daemon=True)
+        self._janitor.start()
+    
+    def stop_janitor(self) -> None:
+        self._janitor_stop.set()
+        if self._janitor is not None:
+            self._janitor.join()
+            self._janitor = None
+    
+    def _is_persistent(self, prefix: str) -> bool:
+        return self.disk_cache is not None and prefix in self.persistent_prefixes
     
     def _make_key(self, prefix: str, identifier: str) -> str:
         return f"{prefix}:{identifier}"
     
-    def get(self, prefix: str, identifier: str) -> Optional[Any]:
+    def _shard_for(self, key: str) -> _CacheShard:
+        return self._shards[hash(key) % len(self._shards)]
+    
+    def get(self, prefix: str, identifier: str, refresh: Optional[Callable[[], Any]] = None) -> Optional[Any]:
         key = self._make_key(prefix, identifier)
+        shard = self._shard_for(key)
+        now = time.monotonic()
         
-        if key not in self.cache:
-            return None
+        with shard.lock:
+            entry = shard.lookup(prefix, key, now)
         
-        entry = self.cache[key]
-        expires_at = entry.get('expires_at')
+        if entry is not None:
+            stale_at = entry['stale_at']
+            if refresh is not None and stale_at is not None and now >= stale_at:
+                self._schedule_refresh(prefix, identifier, refresh, entry['ttl'], entry['stale_ttl'], entry['tags'])
+            return self._decode(prefix, key, entry['codec'], entry['data'])
         
-        if expires_at and datetime.now() > expires_at:
-            del self.cache[key]
-            return None
+        if self._is_persistent(prefix):
+            stored = self.disk_cache.get(prefix, identifier)
+            if stored is not None:
+                data, remaining_ttl, tags, codec_name = stored
+                size = sys.getsizeof(data) if codec_name else None
+                self._set_memory(prefix, key, data, remaining_ttl, tags=tags, codec_name=codec_name, size=size)
+                with self._metrics_lock:
+                    self._metrics_for(prefix)['disk_hits'] += 1
+                return self._decode(prefix, key, codec_name, data)
         
-        return entry.get('data')
+        return None
     
-    def set(self, prefix: str, identifier: str, data: Any, ttl_seconds: Optional[int] = None) -> None:
+    def peek(self, prefix: str, identifier: str) -> Optional[Any]:
         key = self._make_key(prefix, identifier)
-        ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
-        expires_at = datetime.now() + timedelta(seconds=ttl)
+        shard = self._shard_for(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is None or time.monotonic() >= entry['expires_at']:
+                return None
+        return self._decode(prefix, key, entry['codec'], entry['data'])
+    
+    def _schedule_refresh(self, prefix: str, identifier: str, refresh: Callable[[], Any],
+                          ttl: float, stale_ttl: Optional[float], tags: Tuple[str, ...] = ()) -> None:
+        key = self._make_key(prefix, identifier)
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=CACHE_REFRESH_WORKERS, thread_name_prefix="cache-refresh"
+                )
+            self.background_refreshes += 1
+        
+        def run_refresh():
+            try:
+                started_at = time.perf_counter()
+                data = refresh()
+                self.record_fill(prefix, time.perf_counter() - started_at, background=True)
+                if data is not None:
+                    self.set(prefix, identifier, data, ttl_seconds=ttl, stale_ttl_seconds=stale_ttl, tags=tags)
+            except Exception as e:
+                print(f"Error refreshing cache entry {key}: {e}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
         
-        self.cache[key] = {
+        self._refresh_executor.submit(run_refresh)
+    
+    def _metrics_for(self, prefix: str) -> Dict[str, float]:
+        metrics = self._prefix_metrics.get(prefix)
+        if metrics is None:
+            metrics = self._prefix_metrics[prefix] = {
+                'disk_hits': 0, 'fills': 0, 'background_fills': 0, 'fill_seconds': 0.0, 'max_fill_seconds': 0.0
+            }
+        return metrics
+    
+    def record_fill(self, prefix: str, seconds: float, background: bool = False) -> None:
+        with self._metrics_lock:
+            metrics = self._metrics_for(prefix)
+            metrics['fills'] += 1
+            metrics['fill_seconds'] += seconds
+            metrics['max_fill_seconds'] = max(metrics['max_fill_seconds'], seconds)
+            if background:
+                metrics['background_fills'] += 1
+    
+    def _encode(self, prefix: str, key: str, data: Any) -> Tuple[Any, Optional[str], int]:
+        raw_size = estimate_size_bytes(data)
+        codec = self.codecs.get(prefix)
+        if codec is None or raw_size < self.compression_min_bytes:
+            return data, None, raw_size
+        
+        started_at = time.perf_counter()
+        try:
+            payload = codec.encode(data)
+        except (TypeError, ValueError):
+            return data, None, raw_size
+        elapsed = time.perf_counter() - started_at
+        
+        size = sys.getsizeof(payload)
+        shard = self._shard_for(key)
+        with shard.lock:
+            shard.count_codec(prefix, encodes=1, encode_seconds=elapsed, raw_bytes=raw_size, encoded_bytes=size)
+        return payload, codec.name, size
+    
+    def _decode(self, prefix: str, key: str, codec_name: Optional[str], data: Any) -> Any:
+        if codec_name is None:
+            return data
+        
+        started_at = time.perf_counter()
+        value = get_codec(codec_name).decode(data)
+        elapsed = time.perf_counter() - started_at
+        
+        shard = self._shard_for(key)
+        with shard.lock:
+            shard.count_codec(prefix, decodes=1, decode_seconds=elapsed)
+        return value
+    
+    def _set_memory(self, prefix: str, key: str, data: Any, ttl: float, stale_ttl: Optional[float] = None,
+                    tags: Iterable[str] = (), codec_name: Optional[str] = None, size: Optional[int] = None) -> None:
+        now = time.monotonic()
+        stale_at = now + ttl if stale_ttl else None
+        expires_at = now + ttl + (stale_ttl or 0)
+        
+        entry = {
             'data': data,
             'expires_at': expires_at,
-            'cached_at': datetime.now()
+            'stale_at': stale_at,
+            'ttl': ttl,
+            'stale_ttl': stale_ttl,
+            'prefix': prefix,
+            'tags': tuple(tags),
+            'codec': codec_name,
+            'size': estimate_size_bytes(key) + (size if size is not None else estimate_size_bytes(data))
         }
+        
+        shard = self._shard_for(key)
+        with shard.lock:
+            shard.put(key, entry)
+    
+    def set(self, prefix: str, identifier: str, data: Any, ttl_seconds: Optional[int] = None,
+            stale_ttl_seconds: Optional[int] = None, tags: Optional[Iterable[str]] = None) -> None:
+        key = self._make_key(prefix, identifier)
+        ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
+        tags = tuple(tags or ())
+        value, codec_name, size = self._encode(prefix, key, data)
+        self._set_memory(prefix, key, value, ttl, stale_ttl_seconds, tags, codec_name, size)
+        
+        if self._is_persistent(prefix):
+            self.disk_cache.set(prefix, identifier, value, ttl + (stale_ttl_seconds or 0), tags, codec_name)
     
     def invalidate(self, prefix: str, identifier: str) -> None:
         key = self._make_key(prefix, identifier)
-        if key in self.cache:
-            del self.cache[key]
+        shard = self._shard_for(key)
+        with shard.lock:
+            shard.remove(key)
+        if self._is_persistent(prefix):
+            self.disk_cache.invalidate(prefix, identifier)
     
     def invalidate_prefix(self, prefix: str) -> None:
-        keys_to_remove = [key for key in self.cache.keys() if key.startswith(f"{prefix}:")]
-        for key in keys_to_remove:
-            del self.cache[key]
+        for shard in self._shards:
+            with shard.lock:
+                shard.remove_prefix(prefix)
+        if self._is_persistent(prefix):
+            self.disk_cache.invalidate_prefix(prefix)
+    
+    def invalidate_tag(self, tag: str) -> int:
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += len(shard.remove_tag(tag))
+        if self.disk_cache is not None:
+            self.disk_cache.invalidate_tag(tag)
+        return removed
     
     def clear(self) -> None:
-        self.cache.clear()
+        for shard in self._shards:
+            with shard.lock:
+                shard.clear()
+        if self.disk_cache is not None:
+            self.disk_cache.clear()
     
     def get_stats(self) -> Dict[str, Any]:
-        total_entries = len(self.cache)
-        expired_entries = 0
-        valid_entries = 0
-        
-        now = datetime.now()
-        for entry in self.cache.values():
-            expires_at = entry.get('expires_at')
-            if expires_at and now > expires_at:
-                expired_entries += 1
-            else:
-                valid_entries += 1
+        total_entries = 0
+        total_bytes = 0
+        evictions = 0
+        expirations = 0
+        prefix_bytes: Dict[str, int] = {}
+        
+        for shard in self._shards:
+            with shard.lock:
+                total_entries += len(shard.entries)
+                total_bytes += shard.total_bytes
+                evictions += shard.evictions
+                expirations += shard.expirations
+                for prefix, size in shard.prefix_bytes.items():
+                    prefix_bytes[prefix] = prefix_bytes.get(prefix, 0) + size
         
         return {
             'total_entries': total_entries,
-            'valid_entries': valid_entries,
-            'expired_entries': expired_entries,
-            'cache_size_mb': self._estimate_size_mb()
+            'cache_size_mb': round(total_bytes / (1024 * 1024), 2),
+            'evictions': evictions,
+            'expirations': expirations,
+            'background_refreshes': self.background_refreshes,
+            'prefix_size_mb': {
+                prefix: round(size / (1024 * 1024), 2) for prefix, size in prefix_bytes.items()
+            },
+            'prefixes': self.get_prefix_stats()
         }
     
+    def count_disk_entries(self) -> int:
+        return self.disk_cache.count() if self.disk_cache is not None else 0
+    
+    def get_prefix_stats(self) -> Dict[str, Dict[str, Any]]:
+        counters: Dict[str, Dict[str, float]] = {}
+        codec_counters: Dict[str, Dict[str, float]] = {}
+        for shard in self._shards:
+            with shard.lock:
+                for prefix, shard_counters in shard.codec_counters.items():
+                    totals = codec_counters.setdefault(prefix, {})
+                    for name, value in shard_counters.items():
+                        totals[name] = totals.get(name, 0) + value
+                for prefix, shard_counters in shard.prefix_counters.items():
+                    totals = counters.setdefault(prefix, {'entries': 0, 'bytes': 0})
+                    for name, value in shard_counters.items():
+                        totals[name] = totals.get(name, 0) + value
+                for prefix, keys in shard.prefix_keys.items():
+                    totals = counters.setdefault(prefix, {'entries': 0, 'bytes': 0})
+                    totals['entries'] += len(keys)
+                    totals['bytes'] += shard.prefix_bytes.get(prefix, 0)
+        
+        with self._metrics_lock:
+            fill_metrics = {prefix: dict(metrics) for prefix, metrics in self._prefix_metrics.items()}
+        
+        stats = {}
+        for prefix in sorted(set(counters) | set(fill_metrics) | set(codec_counters)):
+            totals = counters.get(prefix, {})
+            fills = fill_metrics.get(prefix, {})
+            codec_totals = codec_counters.get(prefix, {})
+            hits = totals.get('hits', 0) + fills.get('disk_hits', 0)
+            misses = totals.get('misses', 0) - fills.get('disk_hits', 0)
+            lookups = hits + misses
+            fill_count = fills.get('fills', 0)
+            encodes = codec_totals.get('encodes', 0)
+            decodes = codec_totals.get('decodes', 0)
+            stats[prefix] = {
+                'entries': totals.get('entries', 0),
+                'size_mb': round(totals.get('bytes', 0) / (1024 * 1024), 2),
+                'hits': hits,
+                'memory_hits': totals.get('hits', 0),
+                'disk_hits': fills.get('disk_hits', 0),
+                'misses': misses,
+                'hit_ratio': round(hits / lookups, 4) if lookups else None,
+                'evictions': totals.get('evictions', 0),
+                'expirations': totals.get('expirations', 0),
+                'fills': fill_count,
+                'background_fills': fills.get('background_fills', 0),
+                'avg_fill_ms': round(fills.get('fill_seconds', 0.0) / fill_count * 1000, 1) if fill_count else None,
+                'max_fill_ms': round(fills.get('max_fill_seconds', 0.0) * 1000, 1),
+                'codec': self.codecs[prefix].name if prefix in self.codecs else None,
+                'encoded_entries': encodes,
+                'compression_ratio': (
+                    round(codec_totals['raw_bytes'] / codec_totals['encoded_bytes'], 2)
+                    if codec_totals.get('encoded_bytes') else None
+                ),
+                'avg_encode_ms': round(codec_totals['encode_seconds'] / encodes * 1000, 3) if encodes else None,
+                'avg_decode_ms': round(codec_totals['decode_seconds'] / decodes * 1000, 3) if decodes else None
+            }
+        return stats
+    
+    def reset_metrics(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.prefix_counters.clear()
+                shard.codec_counters.clear()
+        with self._metrics_lock:
+            self._prefix_metrics.clear()
+    
     def _estimate_size_mb(self) -> float:
-        import sys
-        total_size = sys.getsizeof(self.cache)
-        for key, value in self.cache.items():
-            total_size += sys.getsizeof(key) + sys.getsizeof(value)
-        return round(total_size / (1024 * 1024), 2)
+        total_bytes = 0
+        for shard in self._shards:
+            with shard.lock:
+                total_bytes += shard.total_bytes
+        return round(total_bytes / (1024 * 1024), 2)
     
     def cleanup_expired(self) -> int:
-        now = datetime.now()
-        keys_to_remove = []
+        now = time.monotonic()
+        removed = 0
         
-        for key, entry in self.cache.items():
-            expires_at = entry.get('expires_at')
-            if expires_at and now > expires_at:
-                keys_to_remove.append(key)
+        for shard in self._shards:
+            with shard.lock:
+                removed += shard.purge_expired(now)
         
-        for key in keys_to_remove:
-            del self.cache[key]
+        if self.disk_cache is not None:
+            self.disk_cache.cleanup_expired()
         
-        return len(keys_to_remove)
+        return removed
 
 _cache_instance: Optional[CacheManager] = None
+_cache_lock = threading.Lock()
 
 def get_cache(ttl_seconds: int = 3600) -> CacheManager:
     global _cache_instance
     if _cache_instance is None:
-        _cache_instance = CacheManager(default_ttl_seconds=ttl_seconds)
+        with _cache_lock:
+            if _cache_instance is None:
+                disk_cache = DiskCache(CACHE_DISK_PATH, CACHE_DISK_PRAGMAS) if CACHE_DISK_ENABLED else None
+                _cache_instance = CacheManager(
+                    default_ttl_seconds=ttl_seconds,
+                    disk_cache=disk_cache,
+                    persistent_prefixes=CACHE_DISK_PREFIXES,
+                    max_memory_mb=CACHE_MAX_MEMORY_MB,
+                    prefix_max_memory_mb=CACHE_PREFIX_MAX_MEMORY_MB,
+                    janitor_interval_seconds=CACHE_JANITOR_INTERVAL,
+                    prefix_codecs=CACHE_PREFIX_CODECS,
+                    compression_min_bytes=CACHE_COMPRESSION_MIN_BYTES
+                )
     return _cache_instance
 
 def clear_cache() -> None:
     global _cache_instance
     if _cache_instance:
         _cache_instance.clear()
-
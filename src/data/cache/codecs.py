@@ -0,0 +1,49 @@
+import json
+import lzma
+import zlib
+from typing import Any, Dict, Optional
+
+class ValueCodec:
+    name = "json"
+    
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+    
+    def decode(self, payload: bytes) -> Any:
+        return json.loads(payload)
+
+class ZlibCodec(ValueCodec):
+    name = "zlib"
+    
+    def __init__(self, level: int = 6):
+        self.level = level
+    
+    def encode(self, value: Any) -> bytes:
+        return zlib.compress(super().encode(value), self.level)
+    
+    def decode(self, payload: bytes) -> Any:
+        return super().decode(zlib.decompress(payload))
+
+class LzmaCodec(ValueCodec):
+    name = "lzma"
+    
+    def __init__(self, preset: int = 6):
+        self.preset = preset
+    
+    def encode(self, value: Any) -> bytes:
+        return lzma.compress(super().encode(value), preset=self.preset)
+    
+    def decode(self, payload: bytes) -> Any:
+        return super().decode(lzma.decompress(payload))
+
+CODECS: Dict[str, ValueCodec] = {
+    codec.name: codec for codec in (ValueCodec(), ZlibCodec(), LzmaCodec())
+}
+
+def get_codec(name: Optional[str]) -> Optional[ValueCodec]:
+    if not name:
+        return None
+    codec = CODECS.get(name)
+    if codec is None:
+        raise ValueError(f"Unknown cache codec: {name}")
+    return codec
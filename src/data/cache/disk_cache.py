@@ -0,0 +1,160 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+class DiskCache:
+    def __init__(self, db_path: str, pragmas: Optional[Dict[str, object]] = None):
+        self.db_path = db_path
+        self.pragmas = dict(pragmas or {})
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._init_db()
+    
+    def _init_db(self) -> None:
+        with self._lock:
+            try:
+                for name, value in self.pragmas.items():
+                    self._conn.execute(f"PRAGMA {name} = {value}")
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS cache_entries (
+                        key TEXT PRIMARY KEY,
+                        prefix TEXT NOT NULL,
+                        data TEXT NOT NULL,
+                        expires_at REAL NOT NULL,
+                        codec TEXT
+                    )
+                """)
+                columns = {row[1] for row in self._conn.execute("PRAGMA table_info(cache_entries)")}
+                if "codec" not in columns:
+                    self._conn.execute("ALTER TABLE cache_entries ADD COLUMN codec TEXT")
+                self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_prefix ON cache_entries(prefix)")
+                self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON cache_entries(expires_at)")
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS cache_tags (
+                        tag TEXT NOT NULL,
+                        key TEXT NOT NULL,
+                        PRIMARY KEY (tag, key)
+                    )
+                """)
+                self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_tags_key ON cache_tags(key)")
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"Cache disk error: {e}")
+    
+    def _make_key(self, prefix: str, identifier: str) -> str:
+        return f"{prefix}:{identifier}"
+    
+    def get(self, prefix: str, identifier: str) -> Optional[Tuple[Any, float, Tuple[str, ...], Optional[str]]]:
+        key = self._make_key(prefix, identifier)
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT data, expires_at, codec FROM cache_entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                
+                data, expires_at, codec_name = row
+                remaining = expires_at - time.time()
+                if remaining <= 0:
+                    self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                    self._conn.execute("DELETE FROM cache_tags WHERE key = ?", (key,))
+                    self._conn.commit()
+                    return None
+                
+                tags = tuple(tag for (tag,) in self._conn.execute(
+                    "SELECT tag FROM cache_tags WHERE key = ?", (key,)
+                ))
+                if codec_name:
+                    return bytes(data), remaining, tags, codec_name
+                return json.loads(data), remaining, tags, None
+            except (sqlite3.Error, ValueError) as e:
+                print(f"Cache disk error: {e}")
+                return None
+    
+    def set(self, prefix: str, identifier: str, data: Any, ttl_seconds: float, tags: Iterable[str] = (),
+            codec_name: Optional[str] = None) -> None:
+        key = self._make_key(prefix, identifier)
+        if codec_name:
+            payload = sqlite3.Binary(data)
+        else:
+            try:
+                payload = json.dumps(data)
+            except (TypeError, ValueError) as e:
+                print(f"Cache disk error: {e}")
+                return
+        
+        with self._lock:
+            try:
+                self._conn.execute("""
+                    INSERT INTO cache_entries (key, prefix, data, expires_at, codec) VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        data = excluded.data, expires_at = excluded.expires_at, codec = excluded.codec
+                """, (key, prefix, payload, time.time() + ttl_seconds, codec_name))
+                self._conn.execute("DELETE FROM cache_tags WHERE key = ?", (key,))
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO cache_tags (tag, key) VALUES (?, ?)",
+                    [(tag, key) for tag in tags]
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"Cache disk error: {e}")
+    
+    def invalidate(self, prefix: str, identifier: str) -> None:
+        key = self._make_key(prefix, identifier)
+        self._execute_many([
+            ("DELETE FROM cache_tags WHERE key = ?", (key,)),
+            ("DELETE FROM cache_entries WHERE key = ?", (key,))
+        ])
+    
+    def invalidate_prefix(self, prefix: str) -> None:
+        self._execute_many([
+            ("DELETE FROM cache_tags WHERE key IN (SELECT key FROM cache_entries WHERE prefix = ?)", (prefix,)),
+            ("DELETE FROM cache_entries WHERE prefix = ?", (prefix,))
+        ])
+    
+    def invalidate_tag(self, tag: str) -> None:
+        self._execute_many([
+            ("DELETE FROM cache_entries WHERE key IN (SELECT key FROM cache_tags WHERE tag = ?)", (tag,)),
+            ("DELETE FROM cache_tags WHERE key IN (SELECT key FROM cache_tags WHERE tag = ?)", (tag,))
+        ])
+    
+    def clear(self) -> None:
+        self._execute_many([
+            ("DELETE FROM cache_tags", ()),
+            ("DELETE FROM cache_entries", ())
+        ])
+    
+    def cleanup_expired(self) -> int:
+        now = time.time()
+        return self._execute_many([
+            ("DELETE FROM cache_tags WHERE key IN (SELECT key FROM cache_entries WHERE expires_at <= ?)", (now,)),
+            ("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        ])
+    
+    def count(self) -> int:
+        with self._lock:
+            try:
+                return self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+            except sqlite3.Error as e:
+                print(f"Cache disk error: {e}")
+                return 0
+    
+    def _execute_many(self, statements: Iterable[Tuple[str, tuple]]) -> int:
+        with self._lock:
+            try:
+                rowcount = 0
+                for query, params in statements:
+                    rowcount = self._conn.execute(query, params).rowcount
+                self._conn.commit()
+                return rowcount
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                print(f"Cache disk error: {e}")
+                return 0
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
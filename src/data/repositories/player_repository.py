@@ -1,20 +1,113 @@
+import json
 import sqlite3
 import sys
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Any, Dict, Iterable, List, Tuple, Optional
 
 root_dir = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(root_dir))
 
-from config.settings import DATABASE_NAME
+from config.settings import DATABASE_NAME, DATABASE_POOL_ENABLED, MATCH_WIN_RESULTS, MATCH_DEFAULT_DEATHS
+from src.data.repositories.connection_pool import get_connection_pool
+
+MATCH_HISTORY_COLUMNS = [
+    ("headshots", "INTEGER"),
+    ("damage", "INTEGER"),
+    ("score", "TEXT"),
+    ("started_at", "INTEGER"),
+    ("finished_at", "INTEGER"),
+    ("stats_json", "TEXT")
+]
+
+AGGREGATE_WIN_RESULTS = "(" + ", ".join(f"'{result}'" for result in MATCH_WIN_RESULTS) + ")"
+
+def _aggregate_deltas(row: str, sign: str) -> Dict[str, str]:
+    win = f"(CASE WHEN lower({row}.result) IN {AGGREGATE_WIN_RESULTS} THEN 1 ELSE 0 END)"
+    rws = (f"(COALESCE({row}.kills, 0) * 2.0 + COALESCE({row}.assists, 0) + COALESCE({row}.damage, 0) * 0.01) "
+           f"* (CASE WHEN lower({row}.result) IN {AGGREGATE_WIN_RESULTS} THEN 1.5 ELSE 1.0 END)")
+    return {
+        "matches": f"{sign}1",
+        "wins": f"{sign}{win}",
+        "kills": f"{sign}COALESCE({row}.kills, 0)",
+        "deaths": f"{sign}COALESCE({row}.deaths, {MATCH_DEFAULT_DEATHS})",
+        "assists": f"{sign}COALESCE({row}.assists, 0)",
+        "headshots": f"{sign}COALESCE({row}.headshots, 0)",
+        "mvps": f"{sign}COALESCE({row}.mvps, 0)",
+        "damage": f"{sign}COALESCE({row}.damage, 0)",
+        "rws_total": f"{sign}{rws}"
+    }
+
+def _aggregate_statements(row: str, sign: str) -> str:
+    deltas = _aggregate_deltas(row, sign)
+    map_deltas = {column: deltas[column] for column in ("matches", "wins", "kills", "deaths", "headshots", "rws_total")}
+    
+    def upsert(table: str, keys: List[str], values: Dict[str, str]) -> str:
+        key_values = [f"{row}.player_id" if key == "player_id" else f"COALESCE({row}.map_name, 'Unknown')" for key in keys]
+        updates = ", ".join(f"{column} = {column} + excluded.{column}" for column in values)
+        return (f"INSERT INTO {table} ({', '.join(keys + list(values))}) "
+                f"VALUES ({', '.join(key_values + list(values.values()))}) "
+                f"ON CONFLICT({', '.join(keys)}) DO UPDATE SET {updates};")
+    
+    return "\n".join([
+        upsert("player_aggregates", ["player_id"], deltas),
+        upsert("player_map_aggregates", ["player_id", "map_name"], map_deltas)
+    ])
+
+AGGREGATE_COLUMNS = ["matches", "wins", "kills", "deaths", "assists", "headshots", "mvps", "damage", "rws_total"]
+
+AGGREGATE_TRIGGERS = {
+    "trg_match_history_aggregate_insert": f"""
+        AFTER INSERT ON match_history
+        BEGIN
+            {_aggregate_statements("NEW", "")}
+        END
+    """,
+    "trg_match_history_aggregate_update": f"""
+        AFTER UPDATE OF player_id, map_name, result, kills, deaths, assists, headshots, mvps, damage ON match_history
+        BEGIN
+            {_aggregate_statements("OLD", "-")}
+            {_aggregate_statements("NEW", "")}
+        END
+    """,
+    "trg_match_history_aggregate_delete": f"""
+        AFTER DELETE ON match_history
+        BEGIN
+            {_aggregate_statements("OLD", "-")}
+        END
+    """
+}
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
 
 class PlayerRepository:
-    def __init__(self, db_name: str = DATABASE_NAME):
+    def __init__(self, db_name: str = DATABASE_NAME, pooled: bool = DATABASE_POOL_ENABLED):
         self.db_name = db_name
+        self.pool = get_connection_pool(db_name) if pooled else None
         self._init_db()
     
+    def _connect(self) -> sqlite3.Connection:
+        if self.pool is not None:
+            return self.pool.acquire()
+        return sqlite3.connect(self.db_name)
+    
+    def _release(self, conn: sqlite3.Connection) -> None:
+        if self.pool is not None:
+            self.pool.release(conn)
+        else:
+            conn.close()
+    
     def _init_db(self):
-        conn = sqlite3.connect(self.db_name)
+        conn = self._connect()
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -43,48 +136,138 @@ class PlayerRepository:
                     hs_percentage REAL,
                     mvps INTEGER,
                     match_date TIMESTAMP,
+                    headshots INTEGER,
+                    damage INTEGER,
+                    score TEXT,
+                    started_at INTEGER,
+                    finished_at INTEGER,
+                    stats_json TEXT,
                     FOREIGN KEY(player_id) REFERENCES players(id)
                 )
             """)
             
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(match_history)")}
+            for name, column_type in MATCH_HISTORY_COLUMNS:
+                if name not in columns:
+                    cursor.execute(f"ALTER TABLE match_history ADD COLUMN {name} {column_type}")
+            
+            cursor.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_match_history_player_match 
+                ON match_history(player_id, match_id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_match_history_player_finished 
+                ON match_history(player_id, finished_at DESC)
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS elo_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    player_id INTEGER NOT NULL,
+                    elo INTEGER,
+                    level INTEGER,
+                    recorded_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                    FOREIGN KEY(player_id) REFERENCES players(id)
+                )
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_elo_history_player_recorded 
+                ON elo_history(player_id, recorded_at)
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_players_elo_insert AFTER INSERT ON players
+                WHEN NEW.elo IS NOT NULL
+                BEGIN
+                    INSERT INTO elo_history (player_id, elo, level) VALUES (NEW.id, NEW.elo, NEW.level);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_players_elo_update AFTER UPDATE OF elo, level ON players
+                WHEN NEW.elo IS NOT NULL
+                BEGIN
+                    INSERT INTO elo_history (player_id, elo, level) VALUES (NEW.id, NEW.elo, NEW.level);
+                END
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS player_aggregates (
+                    player_id INTEGER PRIMARY KEY,
+                    matches INTEGER NOT NULL DEFAULT 0,
+                    wins INTEGER NOT NULL DEFAULT 0,
+                    kills INTEGER NOT NULL DEFAULT 0,
+                    deaths INTEGER NOT NULL DEFAULT 0,
+                    assists INTEGER NOT NULL DEFAULT 0,
+                    headshots INTEGER NOT NULL DEFAULT 0,
+                    mvps INTEGER NOT NULL DEFAULT 0,
+                    damage INTEGER NOT NULL DEFAULT 0,
+                    rws_total REAL NOT NULL DEFAULT 0,
+                    FOREIGN KEY(player_id) REFERENCES players(id)
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS player_map_aggregates (
+                    player_id INTEGER NOT NULL,
+                    map_name TEXT NOT NULL,
+                    matches INTEGER NOT NULL DEFAULT 0,
+                    wins INTEGER NOT NULL DEFAULT 0,
+                    kills INTEGER NOT NULL DEFAULT 0,
+                    deaths INTEGER NOT NULL DEFAULT 0,
+                    headshots INTEGER NOT NULL DEFAULT 0,
+                    rws_total REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY(player_id, map_name),
+                    FOREIGN KEY(player_id) REFERENCES players(id)
+                )
+            """)
+            existing_triggers = dict(cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'").fetchall())
+            definitions = {name: f"CREATE TRIGGER {name} {body.strip()}" for name, body in AGGREGATE_TRIGGERS.items()}
+            stale_triggers = [name for name in definitions if existing_triggers.get(name) != definitions[name]]
+            for name in stale_triggers:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+                cursor.execute(definitions[name])
+            if stale_triggers:
+                self._rebuild_aggregates(cursor)
+            
+            cursor.execute("""
+                INSERT INTO elo_history (player_id, elo, level, recorded_at)
+                SELECT id, elo, level, CAST(strftime('%s', COALESCE(last_updated, 'now')) AS INTEGER)
+                FROM players p
+                WHERE elo IS NOT NULL AND NOT EXISTS (SELECT 1 FROM elo_history h WHERE h.player_id = p.id)
+            """)
+            
             conn.commit()
         except sqlite3.Error as e:
             print(f"Database error: {e}")
         finally:
-            conn.close()
+            self._release(conn)
     
     def add_player(self, nickname: str, faceit_id: str, elo: int, level: int, avatar_url: Optional[str] = None) -> bool:
-        conn = sqlite3.connect(self.db_name)
+        return self.upsert_players([(nickname, faceit_id, elo, level, avatar_url)]) > 0
+    
+    def upsert_players(self, players: Iterable[Tuple[str, str, Optional[int], Optional[int], Optional[str]]]) -> int:
+        conn = self._connect()
         cursor = conn.cursor()
         try:
-            cursor.execute("""
+            cursor.executemany("""
                 INSERT INTO players (nickname, faceit_id, elo, level, avatar_url, last_updated) 
                 VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (nickname, faceit_id, elo, level, avatar_url))
+                ON CONFLICT(faceit_id) DO UPDATE SET
+                    elo = COALESCE(excluded.elo, elo), 
+                    level = COALESCE(excluded.level, level), avatar_url = COALESCE(excluded.avatar_url, avatar_url), 
+                    last_updated = CURRENT_TIMESTAMP
+                ON CONFLICT(nickname) DO UPDATE SET
+                    elo = COALESCE(excluded.elo, elo), level = COALESCE(excluded.level, level), 
+                    avatar_url = COALESCE(excluded.avatar_url, avatar_url), last_updated = CURRENT_TIMESTAMP
+            """, players)
             conn.commit()
-            return True
-        except sqlite3.IntegrityError as e:
-            existing_player = cursor.execute("""
-                SELECT faceit_id FROM players WHERE nickname = ? OR faceit_id = ?
-            """, (nickname, faceit_id)).fetchone()
-            
-            if existing_player:
-                cursor.execute("""
-                    UPDATE players 
-                    SET elo = ?, level = ?, avatar_url = ?, last_updated = CURRENT_TIMESTAMP 
-                    WHERE nickname = ? OR faceit_id = ?
-                """, (elo, level, avatar_url, nickname, faceit_id))
-                conn.commit()
-                return True
-            return False
+            return cursor.rowcount
         except sqlite3.Error as e:
+            conn.rollback()
             print(f"Database error: {e}")
-            return False
+            return 0
         finally:
-            conn.close()
+            self._release(conn)
     
     def get_all_players(self) -> List[Tuple]:
-        conn = sqlite3.connect(self.db_name)
+        conn = self._connect()
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -97,10 +280,10 @@ class PlayerRepository:
             print(f"Database error: {e}")
             return []
         finally:
-            conn.close()
+            self._release(conn)
     
     def get_player_by_nickname(self, nickname: str) -> Optional[Tuple]:
-        conn = sqlite3.connect(self.db_name)
+        conn = self._connect()
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -113,11 +296,11 @@ class PlayerRepository:
             print(f"Database error: {e}")
             return None
         finally:
-            conn.close()
+            self._release(conn)
     
     def update_player_stats(self, nickname: str, elo: Optional[int] = None, 
                            level: Optional[int] = None, avatar_url: Optional[str] = None) -> bool:
-        conn = sqlite3.connect(self.db_name)
+        conn = self._connect()
         cursor = conn.cursor()
         try:
             updates = []
@@ -146,12 +329,44 @@ class PlayerRepository:
             print(f"Database error: {e}")
             return False
         finally:
-            conn.close()
+            self._release(conn)
+    
+    def update_players_stats_batch(self, updates: Iterable[Tuple[str, Optional[int], Optional[int], Optional[str]]]) -> Dict[str, bool]:
+        conn = self._connect()
+        cursor = conn.cursor()
+        results = {}
+        try:
+            for nickname, elo, level, avatar_url in updates:
+                cursor.execute("""
+                    UPDATE players 
+                    SET elo = COALESCE(?, elo), level = COALESCE(?, level), 
+                        avatar_url = COALESCE(?, avatar_url), last_updated = CURRENT_TIMESTAMP 
+                    WHERE nickname = ?
+                """, (elo, level, avatar_url, nickname))
+                results[nickname] = cursor.rowcount > 0
+            conn.commit()
+            return results
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"Database error: {e}")
+            return {nickname: False for nickname in results}
+        finally:
+            self._release(conn)
     
     def delete_player(self, nickname: str) -> bool:
-        conn = sqlite3.connect(self.db_name)
+        conn = self._connect()
         cursor = conn.cursor()
         try:
+            cursor.execute("""
+                DELETE FROM match_history WHERE player_id IN (SELECT id FROM players WHERE nickname = ?)
+            """, (nickname,))
+            cursor.execute("""
+                DELETE FROM elo_history WHERE player_id IN (SELECT id FROM players WHERE nickname = ?)
+            """, (nickname,))
+            for table in ("player_aggregates", "player_map_aggregates"):
+                cursor.execute(f"""
+                    DELETE FROM {table} WHERE player_id IN (SELECT id FROM players WHERE nickname = ?)
+                """, (nickname,))
             cursor.execute("DELETE FROM players WHERE nickname=?", (nickname,))
             conn.commit()
             return cursor.rowcount > 0
@@ -159,5 +374,304 @@ class PlayerRepository:
             print(f"Database error: {e}")
             return False
         finally:
-            conn.close()
-
+            self._release(conn)
+    
+    def _match_row(self, faceit_id: str, match: Dict) -> Tuple:
+        stats = match.get("stats") or {}
+        kills = _to_int(stats.get("Kills")) or 0
+        deaths = _to_int(stats.get("Deaths"))
+        headshots = _to_int(stats.get("Headshots")) or 0
+        kd_ratio = _to_float(stats.get("K/D Ratio"))
+        if kd_ratio is None:
+            kd_ratio = round(kills / deaths, 2) if deaths else float(kills)
+        hs_percentage = _to_float(stats.get("Headshots %"))
+        if hs_percentage is None:
+            hs_percentage = round(headshots / kills * 100, 1) if kills > 0 else 0.0
+        
+        return (
+            match.get("match_id"),
+            match.get("map"),
+            match.get("result"),
+            kills,
+            deaths,
+            _to_int(stats.get("Assists")) or 0,
+            kd_ratio,
+            hs_percentage,
+            _to_int(stats.get("MVPs")) or 0,
+            match.get("date"),
+            headshots,
+            _to_int(stats.get("Damage")) or 0,
+            match.get("score"),
+            _to_int(match.get("started_at")),
+            _to_int(match.get("finished_at")),
+            json.dumps(stats),
+            faceit_id
+        )
+    
+    def save_matches(self, faceit_id: str, matches: Iterable[Dict]) -> int:
+        return self.upsert_matches((faceit_id, match) for match in matches)
+    
+    def upsert_matches(self, matches: Iterable[Tuple[str, Dict]]) -> int:
+        conn = self._connect()
+        cursor = conn.cursor()
+        try:
+            rows = (self._match_row(faceit_id, match) for faceit_id, match in matches if match.get("match_id"))
+            cursor.executemany("""
+                INSERT INTO match_history (
+                    player_id, match_id, map_name, result, kills, deaths, assists, kd_ratio, 
+                    hs_percentage, mvps, match_date, headshots, damage, score, started_at, finished_at, stats_json
+                ) 
+                SELECT id, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ? FROM players WHERE faceit_id = ?
+                ON CONFLICT(player_id, match_id) DO UPDATE SET
+                    map_name = excluded.map_name, result = excluded.result, kills = excluded.kills, 
+                    deaths = excluded.deaths, assists = excluded.assists, kd_ratio = excluded.kd_ratio, 
+                    hs_percentage = excluded.hs_percentage, mvps = excluded.mvps, match_date = excluded.match_date, 
+                    headshots = excluded.headshots, damage = excluded.damage, score = excluded.score, 
+                    started_at = excluded.started_at, finished_at = excluded.finished_at, 
+                    stats_json = excluded.stats_json
+            """, rows)
+            conn.commit()
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"Database error: {e}")
+            return 0
+        finally:
+            self._release(conn)
+    
+    def _row_to_match(self, row: Tuple) -> Dict:
+        match_id, map_name, result, match_date, score, started_at, finished_at, stats_json = row
+        return {
+            "match_id": match_id,
+            "map": map_name,
+            "date": match_date if match_date is not None else "",
+            "started_at": started_at if started_at is not None else "",
+            "finished_at": finished_at if finished_at is not None else "",
+            "result": result or "Unknown",
+            "score": score or "Unknown",
+            "stats": json.loads(stats_json) if stats_json else {}
+        }
+    
+    def get_recent_matches(self, faceit_id: str, limit: int = 20) -> List[Dict]:
+        conn = self._connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT m.match_id, m.map_name, m.result, m.match_date, m.score, m.started_at, m.finished_at, m.stats_json
+                FROM match_history m
+                JOIN players p ON p.id = m.player_id
+                WHERE p.faceit_id = ?
+                ORDER BY m.finished_at DESC
+                LIMIT ?
+            """, (faceit_id, limit))
+            return [self._row_to_match(row) for row in cursor.fetchall()]
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Database error: {e}")
+            return []
+        finally:
+            self._release(conn)
+    
+    def get_matches_by_ids(self, faceit_id: str, match_ids: List[str]) -> Dict[str, Dict]:
+        if not match_ids:
+            return {}
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        try:
+            placeholders = ", ".join("?" for _ in match_ids)
+            cursor.execute(f"""
+                SELECT m.match_id, m.map_name, m.result, m.match_date, m.score, m.started_at, m.finished_at, m.stats_json
+                FROM match_history m
+                JOIN players p ON p.id = m.player_id
+                WHERE p.faceit_id = ? AND m.match_id IN ({placeholders})
+            """, [faceit_id] + list(match_ids))
+            return {row[0]: self._row_to_match(row) for row in cursor.fetchall()}
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Database error: {e}")
+            return {}
+        finally:
+            self._release(conn)
+    
+    def get_elo_history(self, faceit_id: str, start: Optional[int] = None, end: Optional[int] = None) -> List[Tuple]:
+        conn = self._connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT h.recorded_at, h.elo, h.level
+                FROM elo_history h
+                JOIN players p ON p.id = h.player_id
+                WHERE p.faceit_id = ? AND h.recorded_at BETWEEN ? AND ?
+                ORDER BY h.recorded_at, h.id
+            """, (faceit_id, start if start is not None else 0, end if end is not None else sys.maxsize))
+            return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return []
+        finally:
+            self._release(conn)
+    
+    def get_elo_series(self, faceit_id: str, bucket_seconds: int, start: Optional[int] = None, 
+                       end: Optional[int] = None) -> List[Tuple]:
+        conn = self._connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT (h.recorded_at / ?) * ? AS bucket, h.elo, h.level, MAX(h.id)
+                FROM elo_history h
+                JOIN players p ON p.id = h.player_id
+                WHERE p.faceit_id = ? AND h.recorded_at BETWEEN ? AND ?
+                GROUP BY bucket
+                ORDER BY bucket
+            """, (bucket_seconds, bucket_seconds, faceit_id, start if start is not None else 0, 
+                  end if end is not None else sys.maxsize))
+            return [row[:3] for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return []
+        finally:
+            self._release(conn)
+    
+    def get_elo_changes(self, since: int, until: Optional[int] = None, limit: Optional[int] = None,
+                        gains_only: bool = False) -> List[Tuple]:
+        conn = self._connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT nickname, faceit_id, start_elo, end_elo, end_elo - start_elo AS delta
+                FROM (
+                    SELECT p.nickname, p.faceit_id,
+                        COALESCE(
+                            (SELECT elo FROM elo_history WHERE player_id = p.id AND recorded_at <= ? 
+                             ORDER BY recorded_at DESC, id DESC LIMIT 1),
+                            (SELECT elo FROM elo_history WHERE player_id = p.id AND recorded_at >= ? 
+                             ORDER BY recorded_at, id LIMIT 1)
+                        ) AS start_elo,
+                        (SELECT elo FROM elo_history WHERE player_id = p.id AND recorded_at <= ? 
+                         ORDER BY recorded_at DESC, id DESC LIMIT 1) AS end_elo
+                    FROM players p
+                )
+                WHERE start_elo IS NOT NULL AND end_elo IS NOT NULL AND (? = 0 OR end_elo > start_elo)
+                ORDER BY delta DESC, end_elo DESC
+                LIMIT COALESCE(?, -1)
+            """, (since, since, until if until is not None else sys.maxsize, int(gains_only), limit))
+            return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return []
+        finally:
+            self._release(conn)
+    
+    def _rebuild_aggregates(self, cursor: sqlite3.Cursor) -> None:
+        deltas = _aggregate_deltas("m", "")
+        map_columns = ["matches", "wins", "kills", "deaths", "headshots", "rws_total"]
+        cursor.execute("DELETE FROM player_aggregates")
+        cursor.execute("DELETE FROM player_map_aggregates")
+        cursor.execute(f"""
+            INSERT INTO player_aggregates (player_id, {', '.join(AGGREGATE_COLUMNS)})
+            SELECT m.player_id, {', '.join(f"SUM({deltas[column]})" for column in AGGREGATE_COLUMNS)}
+            FROM match_history m
+            GROUP BY m.player_id
+        """)
+        cursor.execute(f"""
+            INSERT INTO player_map_aggregates (player_id, map_name, {', '.join(map_columns)})
+            SELECT m.player_id, COALESCE(m.map_name, 'Unknown'), {', '.join(f"SUM({deltas[column]})" for column in map_columns)}
+            FROM match_history m
+            GROUP BY m.player_id, COALESCE(m.map_name, 'Unknown')
+        """)
+    
+    def rebuild_aggregates(self) -> bool:
+        conn = self._connect()
+        cursor = conn.cursor()
+        try:
+            self._rebuild_aggregates(cursor)
+            conn.commit()
+            return True
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"Database error: {e}")
+            return False
+        finally:
+            self._release(conn)
+    
+    def _aggregate_to_stats(self, row: Tuple) -> Dict:
+        nickname, faceit_id, matches, wins, kills, deaths, assists, headshots, mvps, damage, rws_total = row
+        return {
+            "player": nickname,
+            "faceit_id": faceit_id,
+            "matches_played": matches,
+            "wins": wins,
+            "losses": matches - wins,
+            "win_rate": (wins / matches) * 100 if matches > 0 else 0,
+            "total_kills": kills,
+            "total_deaths": deaths,
+            "total_assists": assists,
+            "avg_kd": kills / deaths if deaths > 0 else 0,
+            "avg_hs": (headshots / kills * 100) if kills > 0 else 0,
+            "total_mvp": mvps,
+            "total_damage": damage,
+            "rws": round(rws_total / matches, 2) if matches > 0 else 0.0
+        }
+    
+    def get_player_aggregates(self, faceit_id: str) -> Optional[Dict]:
+        conn = self._connect()
+        cursor = conn.cursor()
+        try:
+            row = cursor.execute(f"""
+                SELECT p.nickname, p.faceit_id, {', '.join(f"a.{column}" for column in AGGREGATE_COLUMNS)}
+                FROM player_aggregates a
+                JOIN players p ON p.id = a.player_id
+                WHERE p.faceit_id = ? AND a.matches > 0
+            """, (faceit_id,)).fetchone()
+            return self._aggregate_to_stats(row) if row else None
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return None
+        finally:
+            self._release(conn)
+    
+    def get_all_player_aggregates(self) -> List[Dict]:
+        conn = self._connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"""
+                SELECT p.nickname, p.faceit_id, {', '.join(f"a.{column}" for column in AGGREGATE_COLUMNS)}
+                FROM player_aggregates a
+                JOIN players p ON p.id = a.player_id
+                WHERE a.matches > 0
+                ORDER BY p.elo DESC
+            """)
+            return [self._aggregate_to_stats(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return []
+        finally:
+            self._release(conn)
+    
+    def get_player_map_aggregates(self, faceit_id: str) -> List[Dict]:
+        conn = self._connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT a.map_name, a.matches, a.wins, a.kills, a.deaths, a.headshots, a.rws_total
+                FROM player_map_aggregates a
+                JOIN players p ON p.id = a.player_id
+                WHERE p.faceit_id = ? AND a.matches > 0
+                ORDER BY a.matches DESC, a.map_name
+            """, (faceit_id,))
+            return [
+                {
+                    "map": map_name,
+                    "matches_played": matches,
+                    "wins": wins,
+                    "win_rate": (wins / matches) * 100,
+                    "avg_kd": kills / deaths if deaths > 0 else 0,
+                    "avg_hs": (headshots / kills * 100) if kills > 0 else 0,
+                    "rws": round(rws_total / matches, 2)
+                }
+                for map_name, matches, wins, kills, deaths, headshots, rws_total in cursor.fetchall()
+            ]
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return []
+        finally:
+            self._release(conn)
@@ -5,7 +5,7 @@ from pathlib import Path
 root_dir = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(root_dir))
 
-from config.settings import APP_TITLE, APP_ICON, APP_LAYOUT
+from config.settings import APP_TITLE, APP_ICON, APP_LAYOUT, DIAGNOSTICS_ENABLED
 
 def setup_page_config():
     st.set_page_config(
@@ -193,9 +193,13 @@ def get_navigation_menu():
         st.markdown("## 🦁 LeleoTV CS2")
         st.markdown("---")
         
+        pages = ["🏠 Dashboard", "🏆 Ranking", "👥 Perfis", "📊 Estatísticas", "📈 Análise de Desempenho", "➕ Gerenciar"]
+        if DIAGNOSTICS_ENABLED:
+            pages.append("🩺 Diagnóstico")
+        
         page = st.radio(
             "Navegação",
-            ["🏠 Dashboard", "🏆 Ranking", "👥 Perfis", "📊 Estatísticas", "📈 Análise de Desempenho", "➕ Gerenciar"],
+            pages,
             key="navigation"
         )
         
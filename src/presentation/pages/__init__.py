@@ -7,6 +7,7 @@ from .statistics_page import render_statistics_page
 from .manage_players_page import render_manage_players_page
 from .performance_page import render_performance_page
 from .dashboard_page import render_dashboard_page
+from .diagnostics_page import render_diagnostics_page
 
 __all__ = [
     'render_ranking_page',
@@ -14,6 +15,7 @@ __all__ = [
     'render_statistics_page',
     'render_manage_players_page',
     'render_performance_page',
-    'render_dashboard_page'
+    'render_dashboard_page',
+    'render_diagnostics_page'
 ]
 
@@ -3,7 +3,6 @@ import pandas as pd
 from ...business.services.player_service import PlayerService
 from ...business.services.ranking_service import RankingService
 from ...business.services.match_service import MatchService
-from ...business.processors.data_processor import calculate_rws
 
 def render_dashboard_page(player_service: PlayerService, ranking_service: RankingService, match_service: MatchService):
     st.title("🏠 Dashboard")
@@ -65,7 +64,7 @@ def render_dashboard_page(player_service: PlayerService, ranking_service: Rankin
             matches = match_service.get_player_matches(player_data[1], limit=20)
             if matches:
                 stats = player_service.get_player_stats(player_data[1], selected_player)
-                rws_score = calculate_rws(matches, player_data[1])
+                rws_score = match_service.get_rws(matches, player_data[1])
                 
                 if stats:
                     col1, col2, col3, col4, col5 = st.columns(5)
@@ -0,0 +1,72 @@
+import streamlit as st
+import pandas as pd
+from ...business.services.diagnostics_service import DiagnosticsService
+
+def render_diagnostics_page(diagnostics_service: DiagnosticsService):
+    st.title("🩺 Diagnóstico")
+    st.caption("Métricas de cache e da API FACEIT desde o início do processo")
+    
+    cache_stats = diagnostics_service.get_cache_stats()
+    api_stats = diagnostics_service.get_api_stats()
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Entradas em memória", cache_stats['total_entries'])
+    with col2:
+        st.metric("Memória (MB)", cache_stats['cache_size_mb'])
+    with col3:
+        st.metric("Entradas em disco", cache_stats['disk_entries'])
+    with col4:
+        st.metric("Atualizações em segundo plano", cache_stats['background_refreshes'])
+    
+    st.markdown("---")
+    st.subheader("🗃️ Cache por prefixo")
+    if cache_stats['prefixes']:
+        df_cache = pd.DataFrame.from_dict(cache_stats['prefixes'], orient='index')
+        df_cache.index.name = "Prefixo"
+        st.dataframe(df_cache, width='stretch')
+    else:
+        st.info("Nenhuma consulta ao cache registrada ainda.")
+    
+    st.markdown("---")
+    st.subheader("🌐 API FACEIT")
+    
+    limiter = api_stats['rate_limiter']
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Requisições", limiter['total_requests'])
+    with col2:
+        st.metric("Requisições atrasadas", limiter['throttled_requests'])
+    with col3:
+        st.metric("Respostas 429", limiter['rate_limited_responses'])
+    with col4:
+        st.metric("Chamadas agrupadas", api_stats['coalesced_calls'])
+    
+    endpoints = api_stats['endpoints']
+    if endpoints:
+        df_latency = pd.DataFrame([
+            {
+                'Endpoint': endpoint,
+                'Chamadas': stats['count'],
+                'Média (ms)': stats['avg_ms'],
+                'p50 (ms)': stats['p50_ms'],
+                'p95 (ms)': stats['p95_ms'],
+                'Máx (ms)': stats['max_ms']
+            }
+            for endpoint, stats in endpoints.items()
+        ])
+        st.dataframe(df_latency, width='stretch', hide_index=True)
+        
+        tab_histogram, tab_status = st.tabs(["Latência", "Status HTTP"])
+        with tab_histogram:
+            df_histogram = pd.DataFrame({endpoint: stats['histogram'] for endpoint, stats in endpoints.items()})
+            st.bar_chart(df_histogram)
+        with tab_status:
+            df_status = pd.DataFrame({endpoint: stats['status_codes'] for endpoint, stats in endpoints.items()}).fillna(0)
+            st.dataframe(df_status.astype(int), width='stretch')
+    else:
+        st.info("Nenhuma chamada à API registrada ainda.")
+    
+    if st.button("🔄 Zerar métricas"):
+        diagnostics_service.reset()
+        st.rerun()
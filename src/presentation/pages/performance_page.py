@@ -2,7 +2,6 @@ import streamlit as st
 import pandas as pd
 from ...business.services.player_service import PlayerService
 from ...business.services.match_service import MatchService
-from ...business.processors.data_processor import calculate_rws
 
 def render_performance_page(player_service: PlayerService, match_service: MatchService):
     st.title("📈 Análise de Desempenho")
@@ -16,7 +15,7 @@ def render_performance_page(player_service: PlayerService, match_service: MatchS
                 matches = match_service.get_player_matches(player_data[1], limit=20)
                 if matches:
                     performance_data = player_service.get_player_stats(player_data[1], selected_player)
-                    rws_score = calculate_rws(matches, player_data[1])
+                    rws_score = match_service.get_rws(matches, player_data[1])
                     
                     if performance_data:
                         st.markdown("---")
@@ -135,10 +134,7 @@ def render_performance_page(player_service: PlayerService, match_service: MatchS
                                     st.line_chart(hs_df.set_index('Partida'), height=300)
                                 
                                 st.markdown("##### RWS por Partida")
-                                rws_per_match = []
-                                for match in matches:
-                                    rws = calculate_rws([match], player_data[1])
-                                    rws_per_match.append(rws)
+                                rws_per_match = match_service.get_rws_per_match(matches, player_data[1])
                                 
                                 rws_df = pd.DataFrame({
                                     'Partida': range(1, len(rws_per_match) + 1),
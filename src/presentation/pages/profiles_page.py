@@ -2,7 +2,6 @@ import streamlit as st
 import pandas as pd
 from ...business.services.player_service import PlayerService
 from ...business.services.match_service import MatchService
-from ...business.processors.data_processor import calculate_rws
 
 def render_profiles_page(player_service: PlayerService, match_service: MatchService):
     st.title("👥 Perfis dos Jogadores")
@@ -20,13 +19,20 @@ def render_profiles_page(player_service: PlayerService, match_service: MatchServ
                     st.markdown("---")
                     st.metric("Nível FACEIT", player_data[3])
                     st.metric("ELO", player_data[2])
+                    
+                    elo_trend = player_service.get_elo_trend(player_data[1])
+                    if len(elo_trend) > 1:
+                        trend_df = pd.DataFrame(elo_trend)
+                        trend_df['Data'] = pd.to_datetime(trend_df['recorded_at'], unit='s')
+                        st.caption("Evolução do ELO")
+                        st.line_chart(trend_df.set_index('Data')[['elo']], height=200)
                 
                 with col2:
                     st.subheader("📊 Estatísticas Recentes")
                     matches = match_service.get_player_matches(player_data[1], limit=20)
                     if matches:
                         stats = player_service.get_player_stats(player_data[1], selected_player)
-                        rws_score = calculate_rws(matches, player_data[1])
+                        rws_score = match_service.get_rws(matches, player_data[1])
                         
                         if stats:
                             col_a, col_b, col_c, col_d = st.columns(4)
@@ -43,6 +49,32 @@ def render_profiles_page(player_service: PlayerService, match_service: MatchServ
                             st.subheader("🎮 Últimas Partidas")
                             match_data = match_service.format_match_data_for_display(matches, limit=10, player_id=player_data[1])
                             st.dataframe(pd.DataFrame(match_data), width='stretch', hide_index=True)
+                        
+                        lifetime_stats = player_service.get_lifetime_stats(player_data[1])
+                        if lifetime_stats:
+                            with st.expander("📚 Histórico Local", expanded=False):
+                                col_a, col_b, col_c, col_d = st.columns(4)
+                                with col_a:
+                                    st.metric("Partidas", lifetime_stats['matches_played'])
+                                with col_b:
+                                    st.metric("Win Rate", f"{lifetime_stats['win_rate']:.1f}%")
+                                with col_c:
+                                    st.metric("K/D Ratio", f"{lifetime_stats['avg_kd']:.2f}")
+                                with col_d:
+                                    st.metric("RWS", f"{lifetime_stats['rws']:.2f}")
+                                
+                                map_stats = player_service.get_map_stats(player_data[1])
+                                if map_stats:
+                                    map_df = pd.DataFrame(map_stats).rename(columns={
+                                        'map': 'Mapa',
+                                        'matches_played': 'Partidas',
+                                        'wins': 'Vitórias',
+                                        'win_rate': 'Win Rate %',
+                                        'avg_kd': 'K/D',
+                                        'avg_hs': 'HS %',
+                                        'rws': 'RWS'
+                                    }).round(2)
+                                    st.dataframe(map_df, width='stretch', hide_index=True)
                     else:
                         st.info("Nenhuma partida encontrada para este jogador.")
     else:
@@ -58,6 +58,19 @@ def render_ranking_page(ranking_service: RankingService):
         st.subheader("📋 Classificação Completa")
         st.dataframe(df_display, width='stretch', hide_index=True)
         
+        climbers = ranking_service.get_top_climbers()
+        if climbers:
+            st.markdown("---")
+            st.subheader("📈 Maiores Subidas da Semana")
+            climbers_df = pd.DataFrame(climbers)
+            climbers_df = climbers_df.rename(columns={
+                'nickname': 'Nickname',
+                'start_elo': 'ELO Inicial',
+                'end_elo': 'ELO Atual',
+                'delta': 'Variação'
+            })[['Nickname', 'ELO Inicial', 'ELO Atual', 'Variação']]
+            st.dataframe(climbers_df, width='stretch', hide_index=True)
+        
         col_btn1, col_btn2 = st.columns([1, 4])
         with col_btn1:
             if st.button("🔄 Atualizar Ranking", width='stretch'):
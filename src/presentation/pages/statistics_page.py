@@ -21,7 +21,7 @@ def render_statistics_page(player_service: PlayerService):
         
         st.markdown("---")
         
-        tab1, tab2, tab3 = st.tabs(["📈 Gráficos", "📋 Tabela Completa", "📊 Análise"])
+        tab1, tab2, tab3, tab4 = st.tabs(["📈 Gráficos", "📋 Tabela Completa", "📊 Análise", "🎯 Desempenho"])
         
         with tab1:
             chart_type = st.selectbox(
@@ -70,6 +70,22 @@ def render_statistics_page(player_service: PlayerService):
             with col2:
                 st.markdown("#### 📊 Estatísticas Descritivas - Nível")
                 st.dataframe(df['Level'].describe(), width='stretch')
+        
+        with tab4:
+            lifetime_stats = player_service.get_all_lifetime_stats()
+            if lifetime_stats:
+                performance_df = pd.DataFrame(lifetime_stats).rename(columns={
+                    'player': 'Nickname',
+                    'matches_played': 'Partidas',
+                    'wins': 'Vitórias',
+                    'win_rate': 'Win Rate %',
+                    'avg_kd': 'K/D',
+                    'avg_hs': 'HS %',
+                    'rws': 'RWS'
+                })[['Nickname', 'Partidas', 'Vitórias', 'Win Rate %', 'K/D', 'HS %', 'RWS']].round(2)
+                st.dataframe(performance_df.sort_values('RWS', ascending=False), width='stretch', hide_index=True)
+            else:
+                st.info("Nenhuma partida armazenada localmente ainda.")
     else:
         st.info("Nenhum jogador cadastrado. Adicione jogadores na seção 'Gerenciar'.")
 
@@ -0,0 +1,56 @@
+"""
+Confere se os agregados mantidos pelos gatilhos batem com os processadores em Python.
+
+Uso:
+    python tools/check_aggregates.py --db leotv_players.db
+
+Para cada jogador com partidas salvas, compara get_player_aggregates com process_player_matches e
+calculate_rws calculados sobre as mesmas partidas de match_history. Sai com código 1 se houver divergência.
+"""
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from config.settings import DATABASE_NAME
+from src.business.processors.data_processor import calculate_rws, process_player_matches
+from src.data.repositories.player_repository import PlayerRepository
+
+COMPARED_FIELDS = ["matches_played", "wins", "losses", "win_rate", "total_kills", "total_deaths",
+                   "total_assists", "avg_kd", "avg_hs", "total_mvp"]
+TOLERANCE = 0.01
+
+def _differs(expected, actual) -> bool:
+    return abs(float(expected) - float(actual)) > TOLERANCE
+
+def check_aggregates(db_path: str) -> List[str]:
+    repository = PlayerRepository(db_path, pooled=False)
+    mismatches = []
+    for aggregate in repository.get_all_player_aggregates():
+        matches = repository.get_recent_matches(aggregate["faceit_id"], limit=aggregate["matches_played"])
+        expected = process_player_matches(matches, aggregate["player"]) or {}
+        expected["rws"] = calculate_rws(matches, aggregate["faceit_id"])
+        for field in COMPARED_FIELDS + ["rws"]:
+            if _differs(expected.get(field, 0), aggregate[field]):
+                mismatches.append(f"{aggregate['player']}: {field} agregado={aggregate[field]} esperado={expected.get(field)}")
+    return mismatches
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Confere os agregados de jogadores contra os processadores.")
+    parser.add_argument("--db", default=DATABASE_NAME, help="Arquivo SQLite a conferir")
+    args = parser.parse_args(argv)
+    
+    mismatches = check_aggregates(args.db)
+    for mismatch in mismatches:
+        print(mismatch)
+    if mismatches:
+        print(f"{len(mismatches)} divergência(s) encontrada(s)")
+        return 1
+    print("Agregados conferem com process_player_matches e calculate_rws")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""
+Exportação e importação em streaming do banco de jogadores (players, match_history e elo_history).
+
+Uso:
+    python tools/db_transfer.py export --db leotv_players.db --dir backup/ --format ndjson
+    python tools/db_transfer.py import --db outro.db --dir backup/ --format ndjson --batch-size 5000
+
+Cada tabela vira um arquivo <tabela>.ndjson ou <tabela>.csv. As linhas de partidas e de ELO referenciam o
+jogador pelo faceit_id, então o arquivo pode ser importado em qualquer banco. A leitura usa cursores com
+fetchmany e a escrita grava em lotes com um commit por lote, mantendo a memória constante.
+Quando elo_history faz parte da importação, os snapshots que os gatilhos de players criam durante a carga
+são descartados e o histórico de cada jogador presente no arquivo é substituído pelo do arquivo, restaurando
+as mesmas linhas; com --merge-elo-history o histórico existente é mantido e só linhas idênticas são ignoradas.
+Linhas de partidas ou de ELO cujo faceit_id não existe em players não são gravadas e são reportadas.
+As tabelas de agregados são mantidas pelos próprios gatilhos.
+"""
+import argparse
+import csv
+import json
+import sqlite3
+import sys
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from config.settings import DATABASE_NAME
+from src.data.repositories.player_repository import PlayerRepository
+
+DEFAULT_BATCH_SIZE = 5000
+FORMATS = ["ndjson", "csv"]
+
+TABLES = {
+    "players": {
+        "columns": ["nickname", "faceit_id", "elo", "level", "avatar_url", "last_updated"],
+        "export": """
+            SELECT nickname, faceit_id, elo, level, avatar_url, last_updated
+            FROM players
+            ORDER BY id
+        """,
+        "import": """
+            INSERT INTO players (nickname, faceit_id, elo, level, avatar_url, last_updated)
+            VALUES (:nickname, :faceit_id, :elo, :level, :avatar_url, COALESCE(:last_updated, CURRENT_TIMESTAMP))
+            ON CONFLICT(faceit_id) DO UPDATE SET
+                nickname = excluded.nickname, elo = excluded.elo, level = excluded.level,
+                avatar_url = excluded.avatar_url, last_updated = excluded.last_updated
+        """
+    },
+    "match_history": {
+        "columns": ["faceit_id", "match_id", "map_name", "result", "kills", "deaths", "assists", "kd_ratio",
+                    "hs_percentage", "mvps", "match_date", "headshots", "damage", "score", "started_at",
+                    "finished_at", "stats_json"],
+        "export": """
+            SELECT p.faceit_id, m.match_id, m.map_name, m.result, m.kills, m.deaths, m.assists, m.kd_ratio,
+                   m.hs_percentage, m.mvps, m.match_date, m.headshots, m.damage, m.score, m.started_at,
+                   m.finished_at, m.stats_json
+            FROM match_history m
+            JOIN players p ON p.id = m.player_id
+            ORDER BY m.id
+        """,
+        "import": """
+            INSERT INTO match_history (
+                player_id, match_id, map_name, result, kills, deaths, assists, kd_ratio, hs_percentage,
+                mvps, match_date, headshots, damage, score, started_at, finished_at, stats_json
+            )
+            SELECT id, :match_id, :map_name, :result, :kills, :deaths, :assists, :kd_ratio, :hs_percentage,
+                   :mvps, :match_date, :headshots, :damage, :score, :started_at, :finished_at, :stats_json
+            FROM players WHERE faceit_id = :faceit_id
+            ON CONFLICT(player_id, match_id) DO UPDATE SET
+                map_name = excluded.map_name, result = excluded.result, kills = excluded.kills,
+                deaths = excluded.deaths, assists = excluded.assists, kd_ratio = excluded.kd_ratio,
+                hs_percentage = excluded.hs_percentage, mvps = excluded.mvps, match_date = excluded.match_date,
+                headshots = excluded.headshots, damage = excluded.damage, score = excluded.score,
+                started_at = excluded.started_at, finished_at = excluded.finished_at,
+                stats_json = excluded.stats_json
+        """
+    },
+    "elo_history": {
+        "columns": ["faceit_id", "elo", "level", "recorded_at"],
+        "export": """
+            SELECT p.faceit_id, h.elo, h.level, h.recorded_at
+            FROM elo_history h
+            JOIN players p ON p.id = h.player_id
+            ORDER BY h.id
+        """,
+        "import": """
+            INSERT INTO elo_history (player_id, elo, level, recorded_at)
+            SELECT id, :elo, :level, :recorded_at FROM players WHERE faceit_id = :faceit_id
+        """
+    }
+}
+
+ELO_HISTORY_MERGE_IMPORT = """
+    INSERT INTO elo_history (player_id, elo, level, recorded_at)
+    SELECT p.id, :elo, :level, :recorded_at FROM players p
+    WHERE p.faceit_id = :faceit_id AND NOT EXISTS (
+        SELECT 1 FROM elo_history h
+        WHERE h.player_id = p.id AND h.recorded_at = :recorded_at AND h.elo IS :elo AND h.level IS :level
+    )
+"""
+
+def iter_rows(conn: sqlite3.Connection, query: str, batch_size: int) -> Iterator[Tuple]:
+    cursor = conn.execute(query)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        yield from rows
+
+def write_rows(path: Path, file_format: str, columns: List[str], rows: Iterable[Tuple]) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        if file_format == "csv":
+            writer = csv.writer(handle)
+            writer.writerow(columns)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        else:
+            for row in rows:
+                handle.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+                handle.write("\n")
+                count += 1
+    return count
+
+def read_rows(path: Path, file_format: str, columns: List[str]) -> Iterator[Dict]:
+    with open(path, "r", encoding="utf-8", newline="") as handle:
+        if file_format == "csv":
+            for record in csv.DictReader(handle):
+                yield {column: record.get(column) or None for column in columns}
+        else:
+            for line in handle:
+                if line.strip():
+                    record = json.loads(line)
+                    yield {column: record.get(column) for column in columns}
+
+def export_database(db_path: str, directory: Path, file_format: str, tables: List[str],
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, int]:
+    directory.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    try:
+        counts = {}
+        for table in tables:
+            spec = TABLES[table]
+            path = directory / f"{table}.{file_format}"
+            counts[table] = write_rows(path, file_format, spec["columns"], iter_rows(conn, spec["export"], batch_size))
+        return counts
+    finally:
+        conn.close()
+
+def _replace_elo_history(conn: sqlite3.Connection, path: Path, file_format: str) -> None:
+    faceit_ids = {row["faceit_id"] for row in read_rows(path, file_format, ["faceit_id"])}
+    conn.executemany("""
+        DELETE FROM elo_history WHERE player_id IN (SELECT id FROM players WHERE faceit_id = ?)
+    """, ((faceit_id,) for faceit_id in faceit_ids))
+    conn.commit()
+
+def import_database(db_path: str, directory: Path, file_format: str, tables: List[str],
+                    batch_size: int = DEFAULT_BATCH_SIZE, merge_elo_history: bool = False) -> Dict[str, int]:
+    PlayerRepository(db_path, pooled=False)
+    conn = sqlite3.connect(db_path)
+    restore_elo_history = "elo_history" in tables and (directory / f"elo_history.{file_format}").exists()
+    try:
+        counts = {}
+        last_snapshot_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM elo_history").fetchone()[0]
+        for table in TABLES:
+            if table not in tables:
+                continue
+            path = directory / f"{table}.{file_format}"
+            if not path.exists():
+                print(f"{path} não encontrado, ignorando {table}")
+                continue
+            
+            spec = TABLES[table]
+            query = spec["import"]
+            if table == "elo_history":
+                if merge_elo_history:
+                    query = ELO_HISTORY_MERGE_IMPORT
+                else:
+                    _replace_elo_history(conn, path, file_format)
+            
+            params = read_rows(path, file_format, spec["columns"])
+            counts[table] = 0
+            skipped = 0
+            while True:
+                batch = list(islice(params, batch_size))
+                if not batch:
+                    break
+                try:
+                    written = conn.executemany(query, batch).rowcount
+                    conn.commit()
+                except sqlite3.Error:
+                    conn.rollback()
+                    raise
+                counts[table] += written
+                skipped += len(batch) - written
+            
+            if skipped:
+                reason = "jogador desconhecido ou snapshot duplicado" if query is ELO_HISTORY_MERGE_IMPORT else "jogador desconhecido"
+                print(f"Aviso: {skipped} linha(s) de {table} não gravada(s) ({reason})")
+            
+            if table == "players" and restore_elo_history:
+                conn.execute("DELETE FROM elo_history WHERE id > ?", (last_snapshot_id,))
+                conn.commit()
+        return counts
+    finally:
+        conn.close()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Exporta e importa o banco de jogadores em NDJSON ou CSV.")
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("--db", default=DATABASE_NAME, help="Arquivo SQLite de origem (export) ou destino (import)")
+    parser.add_argument("--dir", type=Path, required=True, help="Diretório com um arquivo por tabela")
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("--tables", nargs="+", choices=list(TABLES), default=list(TABLES))
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Linhas por fetchmany/commit")
+    parser.add_argument("--merge-elo-history", action="store_true",
+                        help="Mantém o histórico de ELO existente e ignora apenas snapshots idênticos")
+    args = parser.parse_args(argv)
+    
+    try:
+        if args.command == "export":
+            counts = export_database(args.db, args.dir, args.format, args.tables, args.batch_size)
+        else:
+            counts = import_database(args.db, args.dir, args.format, args.tables, args.batch_size,
+                                     args.merge_elo_history)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Erro no {args.command}: {e}")
+        return 1
+    
+    for table, count in counts.items():
+        print(f"{table}: {count} linha(s) {'exportada(s)' if args.command == 'export' else 'gravada(s)'}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""
+Servidor HTTP local que imita os endpoints da FACEIT Data API v4 usados pelo projeto.
+
+Uso:
+    python tools/faceit_stub_server.py --port 8765 --latency-ms 80 --error-rate 0.02 --rate-limit-rate 0.05
+
+Depois aponte a aplicação para ele com FACEIT_API_BASE_URL="http://127.0.0.1:8765/data/v4".
+"""
+import argparse
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = "/data/v4"
+MAPS = ["de_mirage", "de_inferno", "de_nuke", "de_ancient", "de_anubis", "de_dust2", "de_vertigo"]
+MATCH_INTERVAL_SECONDS = 3600
+MATCH_DURATION_SECONDS = 2400
+
+class StubConfig:
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, retry_after: int = 1, history_size: int = 200,
+                 fixtures_dir: Optional[Path] = None, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.history_size = history_size
+        self.fixtures_dir = fixtures_dir
+        self.seed = seed
+        self.base_time = int(time.time())
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+        self.counters_lock = threading.Lock()
+        self.counters: Dict[str, int] = {"requests": 0, "errors": 0, "rate_limited": 0}
+    
+    def roll(self) -> float:
+        with self.random_lock:
+            return self.random.random()
+    
+    def count(self, name: str) -> None:
+        with self.counters_lock:
+            self.counters[name] += 1
+    
+    def snapshot_counters(self) -> Dict[str, int]:
+        with self.counters_lock:
+            return dict(self.counters)
+
+def _rng(config: StubConfig, *parts: Any) -> random.Random:
+    digest = hashlib.sha1(":".join(str(p) for p in (config.seed,) + parts).encode()).hexdigest()
+    return random.Random(int(digest[:16], 16))
+
+def _load_fixture(config: StubConfig, kind: str, name: str) -> Optional[Any]:
+    if config.fixtures_dir is None:
+        return None
+    path = config.fixtures_dir / kind / f"{name}.json"
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def _player_id_for(nickname: str) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"leotv-stub:{nickname.lower()}"))
+
+def build_player(config: StubConfig, nickname: str) -> Dict:
+    rng = _rng(config, "player", nickname.lower())
+    elo = rng.randint(800, 3200)
+    return {
+        "player_id": _player_id_for(nickname),
+        "nickname": nickname,
+        "avatar": None,
+        "games": {
+            "cs2": {
+                "faceit_elo": elo,
+                "skill_level": min(10, max(1, (elo - 500) // 200))
+            }
+        }
+    }
+
+def build_history(config: StubConfig, player_id: str) -> List[Dict]:
+    items = []
+    for index in range(config.history_size):
+        finished_at = config.base_time - index * MATCH_INTERVAL_SECONDS
+        items.append({
+            "match_id": f"{player_id}_{index}",
+            "game_id": "cs2",
+            "started_at": finished_at - MATCH_DURATION_SECONDS,
+            "finished_at": finished_at,
+            "results": {"winner": "faction1" if _rng(config, "result", player_id, index).random() < 0.5 else "faction2"}
+        })
+    return items
+
+def _player_row(rng: random.Random, player_id: str, nickname: str) -> Dict:
+    kills = rng.randint(5, 35)
+    deaths = rng.randint(8, 28)
+    headshots = rng.randint(0, kills)
+    return {
+        "player_id": player_id,
+        "nickname": nickname,
+        "player_stats": {
+            "Kills": str(kills),
+            "Deaths": str(deaths),
+            "Assists": str(rng.randint(0, 12)),
+            "Headshots": str(headshots),
+            "Headshots %": str(round(headshots / kills * 100) if kills else 0),
+            "K/D Ratio": str(round(kills / deaths, 2) if deaths else kills),
+            "MVPs": str(rng.randint(0, 6)),
+            "Damage": str(rng.randint(600, 3500))
+        }
+    }
+
+def build_match_stats(config: StubConfig, match_id: str) -> Dict:
+    owner_id, _, index = match_id.rpartition("_")
+    index = int(index) if index.isdigit() else 0
+    rng = _rng(config, "match", match_id)
+    finished_at = config.base_time - index * MATCH_INTERVAL_SECONDS
+    owner_wins = rng.random() < 0.5
+    
+    teams = []
+    for team_index in range(2):
+        players = []
+        for slot in range(5):
+            if team_index == 0 and slot == 0 and owner_id:
+                player_id, nickname = owner_id, "stub-owner"
+            else:
+                player_id, nickname = str(uuid.UUID(int=rng.getrandbits(128))), f"stub-{team_index}-{slot}"
+            players.append(_player_row(rng, player_id, nickname))
+        won = owner_wins if team_index == 0 else not owner_wins
+        teams.append({
+            "team_id": f"faction{team_index + 1}",
+            "team_stats": {"Team Win": "1" if won else "0", "Final Score": "13" if won else str(rng.randint(3, 11))},
+            "players": players
+        })
+    
+    return {
+        "rounds": [{
+            "match_id": match_id,
+            "round_stats": {
+                "Map": MAPS[rng.randrange(len(MAPS))],
+                "Rounds": str(rng.randint(16, 30)),
+                "Date": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(finished_at))
+            },
+            "teams": teams
+        }]
+    }
+
+def build_player_stats(config: StubConfig, player_id: str) -> Dict:
+    rng = _rng(config, "lifetime", player_id)
+    matches = rng.randint(100, 2000)
+    wins = rng.randint(matches // 3, matches * 2 // 3)
+    return {
+        "player_id": player_id,
+        "game_id": "cs2",
+        "lifetime": {
+            "Matches": str(matches),
+            "Wins": str(wins),
+            "Win Rate %": str(round(wins / matches * 100)),
+            "Average K/D Ratio": str(round(rng.uniform(0.6, 1.6), 2)),
+            "Average Headshots %": str(rng.randint(30, 65))
+        },
+        "segments": []
+    }
+
+def _route(config: StubConfig, path: str, query: Dict[str, List[str]]) -> Tuple[int, Any]:
+    if not path.startswith(API_PREFIX):
+        return 404, {"errors": [{"message": "not found"}]}
+    parts = [p for p in path[len(API_PREFIX):].split("/") if p]
+    
+    if parts == ["players"]:
+        nickname = (query.get("nickname") or [""])[0]
+        if not nickname:
+            return 400, {"errors": [{"message": "nickname is required"}]}
+        return 200, _load_fixture(config, "players", nickname.lower()) or build_player(config, nickname)
+    
+    if len(parts) == 3 and parts[0] == "players" and parts[2] == "history":
+        player_id = parts[1]
+        items = _load_fixture(config, "history", player_id)
+        if items is None:
+            items = build_history(config, player_id)
+        elif isinstance(items, dict):
+            items = items.get("items", [])
+        since = int((query.get("from") or ["0"])[0] or 0)
+        until = int((query.get("to") or ["0"])[0] or 0)
+        if since:
+            items = [m for m in items if (m.get("finished_at") or 0) >= since]
+        if until:
+            items = [m for m in items if (m.get("finished_at") or 0) <= until]
+        offset = int((query.get("offset") or ["0"])[0])
+        limit = min(100, int((query.get("limit") or ["20"])[0]))
+        return 200, {"items": items[offset:offset + limit], "start": offset, "end": offset + limit}
+    
+    if len(parts) == 3 and parts[0] == "matches" and parts[2] == "stats":
+        return 200, _load_fixture(config, "matches", parts[1]) or build_match_stats(config, parts[1])
+    
+    if len(parts) == 4 and parts[0] == "players" and parts[2] == "stats":
+        return 200, _load_fixture(config, "player_stats", parts[1]) or build_player_stats(config, parts[1])
+    
+    return 404, {"errors": [{"message": "not found"}]}
+
+def make_handler(config: StubConfig):
+    class FaceitStubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def do_GET(self):
+            config.count("requests")
+            delay_ms = config.latency_ms + config.jitter_ms * config.roll()
+            if delay_ms > 0:
+                time.sleep(delay_ms / 1000)
+            
+            if config.rate_limit_rate and config.roll() < config.rate_limit_rate:
+                config.count("rate_limited")
+                self._send_json(429, {"errors": [{"message": "Too Many Requests"}]},
+                                {"Retry-After": str(config.retry_after)})
+                return
+            if config.error_rate and config.roll() < config.error_rate:
+                config.count("errors")
+                self._send_json(503, {"errors": [{"message": "Service Unavailable"}]})
+                return
+            
+            parsed = urlparse(self.path)
+            status, payload = _route(config, parsed.path, parse_qs(parsed.query))
+            self._send_json(status, payload)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    return FaceitStubHandler
+
+def create_server(config: StubConfig, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), make_handler(config))
+    server.daemon_threads = True
+    return server
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Servidor local que imita a FACEIT Data API v4 para benchmarks offline.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latência fixa por requisição")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Latência extra aleatória (0..jitter)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fração de respostas 503")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fração de respostas 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Valor do header Retry-After nas respostas 429")
+    parser.add_argument("--history-size", type=int, default=200, help="Partidas sintéticas por jogador")
+    parser.add_argument("--fixtures", type=Path, default=None,
+                        help="Diretório com payloads gravados: players/, history/, matches/, player_stats/")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    
+    config = StubConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        history_size=args.history_size,
+        fixtures_dir=args.fixtures,
+        seed=args.seed
+    )
+    server = create_server(config, args.host, args.port)
+    print(f"FACEIT stub listening on http://{args.host}:{server.server_port}{API_PREFIX}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Requests: {config.snapshot_counters()}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())